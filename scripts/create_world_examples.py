@@ -130,10 +130,11 @@ def example_6_building_plot():
         editor.execute("/fill -32 64 -32 31 64 31 minecraft:quartz_block outline")
 
         # Add some lighting posts
-        for x in range(-24, 32, 16):
-            for z in range(-24, 32, 16):
-                editor.execute(f"/setblock {x} 65 {z} minecraft:oak_fence")
-                editor.execute(f"/setblock {x} 66 {z} minecraft:lantern[hanging=false]")
+        posts = [(x, z) for x in range(-24, 32, 16) for z in range(-24, 32, 16)]
+        fence_positions = [(x, 65, z) for x, z in posts]
+        lantern_positions = [(x, 66, z) for x, z in posts]
+        editor.set_blocks(fence_positions, "minecraft:oak_fence")
+        editor.set_blocks(lantern_positions, "minecraft:lantern[hanging=false]")
 
         editor.save()
 
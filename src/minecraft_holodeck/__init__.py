@@ -1,6 +1,14 @@
-"""Minecraft world modification through command interpretation."""
+"""Minecraft world modification through command interpretation.
+
+The world-editing names (WorldEditor, execute_command, create_*_world) are
+loaded on first access, so importing the package (or the CLI) for parsing
+alone does not pull in amulet and its block translation tables. The parser
+is deferred the same way, so commands that never parse skip Lark too.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from minecraft_holodeck.api import WorldEditor, execute_command
 from minecraft_holodeck.exceptions import (
     BlockValidationError,
     ChunkNotFoundError,
@@ -8,8 +16,11 @@ from minecraft_holodeck.exceptions import (
     MCCommandError,
     WorldOperationError,
 )
-from minecraft_holodeck.parser import CommandParser
-from minecraft_holodeck.world import create_flat_world, create_void_world
+
+if TYPE_CHECKING:
+    from minecraft_holodeck.api import WorldEditor, execute_command
+    from minecraft_holodeck.parser import CommandParser
+    from minecraft_holodeck.world import create_flat_world, create_void_world
 
 __version__ = "0.1.0"
 __all__ = [
@@ -24,3 +35,21 @@ __all__ = [
     "WorldOperationError",
     "ChunkNotFoundError",
 ]
+
+# Attribute name -> module that defines it, imported on first access
+_LAZY_ATTRS = {
+    "CommandParser": "minecraft_holodeck.parser",
+    "WorldEditor": "minecraft_holodeck.api",
+    "execute_command": "minecraft_holodeck.api",
+    "create_flat_world": "minecraft_holodeck.world",
+    "create_void_world": "minecraft_holodeck.world",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import parser and amulet-backed names on first use."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
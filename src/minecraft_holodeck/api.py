@@ -1,11 +1,38 @@
 """High-level Python API for minecraft-holodeck."""
 
+import mmap
+import re
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
 from typing import Any
 
-from minecraft_holodeck.parser import CommandParser, FillCommand, SetblockCommand
+from minecraft_holodeck.compiler import compile_script
+from minecraft_holodeck.parser import FillCommand, SetblockCommand, default_parser
 from minecraft_holodeck.world import WorldModifier, blockspec_to_amulet
 
+# Non-empty lines that don't start with a comment marker
+_LINE_RE = re.compile(rb"(?m)^[^#\r\n][^\r\n]*")
+
+
+def _iter_script_commands(path: Path) -> Iterator[str]:
+    """Yield the commands in a script file, one per line.
+
+    The file is memory-mapped and scanned with a single regex, so large
+    scripts are never read line by line. Blank lines and # comments are
+    skipped.
+
+    Args:
+        path: Script file with one command per line
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _LINE_RE.finditer(mm):
+                line = match.group().decode("utf-8").strip()
+                if line and not line.startswith("#"):
+                    yield line
+
 
 class WorldEditor:
     """High-level API for executing commands on a world.
@@ -29,7 +56,7 @@ class WorldEditor:
         """
         self.world_path = Path(world_path)
         self.origin = origin
-        self.parser = CommandParser()
+        self.parser = default_parser()
         self.modifier = WorldModifier(str(world_path))
 
     def execute(self, command: str) -> int:
@@ -76,8 +103,78 @@ class WorldEditor:
             # This shouldn't happen with proper typing
             raise ValueError(f"Unknown command type: {type(ast)}")
 
+    def execute_many(self, commands: Iterable[str], fold: bool = False) -> int:
+        """Execute several commands, writing each touched chunk once.
+
+        All commands are parsed before the world is modified, so a syntax
+        error leaves the world untouched. Consecutive /setblock and
+        replace/destroy /fill commands are grouped by chunk and written in a
+        single pass; other fill modes are applied in order between groups.
+
+        Args:
+            commands: Command strings, in execution order
+            fold: Collapse overlapping writes to their final state first (see
+                :func:`minecraft_holodeck.planner.fold_writes`). The result
+                is the same world, but the count is of blocks actually
+                written rather than the sum over commands.
+
+        Returns:
+            Number of blocks modified
+
+        Raises:
+            CommandSyntaxError: Invalid command syntax
+            WorldOperationError: World modification failed
+        """
+        program = compile_script(commands, self.origin, fold=fold, parser=self.parser)
+        return program(self.modifier)
+
+    def execute_script(self, script_path: str | Path, fold: bool = False) -> int:
+        """Execute every command in a script file.
+
+        Equivalent to :meth:`execute_many` over the file's lines, skipping
+        blank lines and # comments.
+
+        Args:
+            script_path: File with one command per line
+            fold: Collapse overlapping writes first (see :meth:`execute_many`)
+
+        Returns:
+            Number of blocks modified
+
+        Raises:
+            CommandSyntaxError: Invalid command syntax
+            WorldOperationError: World modification failed
+        """
+        return self.execute_many(_iter_script_commands(Path(script_path)), fold=fold)
+
+    def set_blocks(
+        self, positions: Sequence[tuple[int, int, int]], block: str
+    ) -> int:
+        """Place the same block at many positions in one pass.
+
+        Equivalent to a /setblock per position, but each chunk is touched
+        once and the block is parsed and translated once.
+
+        Args:
+            positions: Absolute (x, y, z) coordinates
+            block: Block string (e.g., "minecraft:lantern[hanging=false]")
+
+        Returns:
+            Number of blocks modified
+
+        Raises:
+            CommandSyntaxError: Invalid block syntax
+            WorldOperationError: World modification failed
+        """
+        spec = self.parser.parse_block(block)
+        return self.modifier.set_blocks(positions, blockspec_to_amulet(spec))
+
     def save(self) -> None:
-        """Save changes to world."""
+        """Save changes to world.
+
+        Safe to call more than once; a save with no pending changes does
+        nothing.
+        """
         self.modifier.save()
 
     def __enter__(self) -> "WorldEditor":
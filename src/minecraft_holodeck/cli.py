@@ -5,6 +5,7 @@ startup performance. Heavy modules like the parser or json are only loaded
 when the specific command that needs them is invoked.
 """
 
+import re
 import sys
 from functools import wraps
 from pathlib import Path
@@ -12,19 +13,49 @@ from typing import Callable, TypeVar
 
 import click
 
-from minecraft_holodeck.api import WorldEditor
-from minecraft_holodeck.converter import ScriptConverter
 from minecraft_holodeck.exceptions import MCCommandError
-from minecraft_holodeck.world import create_flat_world, create_void_world
 
 F = TypeVar("F", bound=Callable[..., None])
 
+# Comma-separated integer tuples for --origin/--base and --size
+_INT_ITEM = r"\s*([+-]?\d+)\s*"
+_INT_TUPLE_RES = {n: re.compile(",".join([_INT_ITEM] * n)) for n in (2, 3)}
 
-def _parse_origin(origin: str) -> tuple[int, int, int]:
+# Read buffer for command files; large batch files are read in 1 MiB blocks
+READ_BUFFER_SIZE = 1 << 20
+
+
+def _parse_int_tuple(value: str, n: int, label: str, axes: str) -> tuple[int, ...]:
+    """Parse a comma-separated string of n integers.
+
+    Args:
+        value: String like "0,64,0"
+        n: Number of integers expected (2 or 3)
+        label: Option name for the error message, e.g. "origin"
+        axes: Axis names for the error message, e.g. "x,y,z"
+
+    Returns:
+        Tuple of n integers
+
+    Raises:
+        click.UsageError: If the string is not n comma-separated integers
+    """
+    match = _INT_TUPLE_RES[n].fullmatch(value)
+    if match is None:
+        words = {2: "two", 3: "three"}[n]
+        raise click.UsageError(
+            f"Invalid {label} format: {label.capitalize()} must be "
+            f"{words} integers ({axes})"
+        )
+    return tuple(int(group) for group in match.groups())
+
+
+def _parse_origin(origin: str, label: str = "origin") -> tuple[int, int, int]:
     """Parse origin string into a coordinate tuple.
 
     Args:
         origin: Comma-separated string like "0,64,0"
+        label: Option name for the error message
 
     Returns:
         Tuple of (x, y, z) integers
@@ -32,13 +63,8 @@ def _parse_origin(origin: str) -> tuple[int, int, int]:
     Raises:
         click.UsageError: If origin format is invalid
     """
-    try:
-        parts = origin.split(",")
-        if len(parts) != 3:
-            raise ValueError("Origin must be three integers (x,y,z)")
-        return (int(parts[0]), int(parts[1]), int(parts[2]))
-    except ValueError as e:
-        raise click.UsageError(f"Invalid origin format: {e}") from e
+    x, y, z = _parse_int_tuple(origin, 3, label, "x,y,z")
+    return (x, y, z)
 
 
 def _parse_size(size: str) -> tuple[int, int]:
@@ -53,13 +79,40 @@ def _parse_size(size: str) -> tuple[int, int]:
     Raises:
         click.UsageError: If size format is invalid
     """
-    try:
-        parts = size.split(",")
-        if len(parts) != 2:
-            raise ValueError("Size must be two integers (x,z)")
-        return (int(parts[0]), int(parts[1]))
-    except ValueError as e:
-        raise click.UsageError(f"Invalid size format: {e}") from e
+    x, z = _parse_int_tuple(size, 2, "size", "x,z")
+    return (x, z)
+
+
+def _ast_to_jsonable(obj: object) -> object:
+    """Convert an AST node to plain dicts and lists for JSON output.
+
+    Unlike dataclasses.asdict, this reads fields directly instead of
+    deep-copying every value along the way. Block states are written as an
+    object ({"facing": "north"}), not as the tuple of pairs BlockSpec keeps.
+
+    Args:
+        obj: AST node, container or scalar
+
+    Returns:
+        JSON-serializable equivalent of obj
+    """
+    from dataclasses import fields, is_dataclass
+
+    from minecraft_holodeck.parser.ast import BlockSpec
+
+    if isinstance(obj, BlockSpec):
+        return {
+            "namespace": obj.namespace,
+            "block_id": obj.block_id,
+            "states": dict(obj.states) if obj.states is not None else None,
+        }
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _ast_to_jsonable(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, (list, tuple)):
+        return [_ast_to_jsonable(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _ast_to_jsonable(value) for key, value in obj.items()}
+    return obj
 
 
 def cli_error_handler(func: F) -> F:
@@ -113,13 +166,14 @@ def execute(world_path: str, command: str, origin: str, dry_run: bool) -> None:
 
     if dry_run:
         # Just parse and show AST
-        from minecraft_holodeck.parser import CommandParser
-        parser = CommandParser()
-        ast = parser.parse(command)
+        from minecraft_holodeck.parser import default_parser
+        ast = default_parser().parse(command)
         click.echo(f"Parsed successfully: {ast}")
         return
 
     # Execute command
+    from minecraft_holodeck.api import WorldEditor
+
     with WorldEditor(world_path, origin_tuple) as editor:
         count = editor.execute(command)
         editor.save()
@@ -128,10 +182,11 @@ def execute(world_path: str, command: str, origin: str, dry_run: bool) -> None:
 
 @main.command()
 @click.argument("world_path", type=click.Path(exists=True))
-@click.argument("commands_file", type=click.File("r"))
+@click.argument("commands_file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--origin", default="0,0,0", help="Origin for relative coords (x,y,z)")
+@click.option("--dry-run", is_flag=True, help="Parse every line but don't touch the world")
 @cli_error_handler
-def batch(world_path: str, commands_file: click.File, origin: str) -> None:
+def batch(world_path: str, commands_file: str, origin: str, dry_run: bool) -> None:
     """Execute multiple commands from a file.
 
     File format: one command per line, # for comments
@@ -139,15 +194,26 @@ def batch(world_path: str, commands_file: click.File, origin: str) -> None:
     Example:
 
         mccommand batch ./my_world commands.txt
+
+        mccommand batch ./my_world commands.txt --dry-run
     """
     origin_tuple = _parse_origin(origin)
 
+    if dry_run:
+        _validate_batch(commands_file)
+        return
+
+    from minecraft_holodeck.api import WorldEditor
+
     total = 0
     errors = 0
 
-    with WorldEditor(world_path, origin_tuple) as editor:
-        for i, line in enumerate(commands_file, 1):  # type: ignore[arg-type,var-annotated]
-            line_str = str(line).strip()
+    with (
+        WorldEditor(world_path, origin_tuple) as editor,
+        open(commands_file, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f,
+    ):
+        for i, line in enumerate(f, 1):
+            line_str = line.strip()
             if not line_str or line_str.startswith("#"):
                 continue
 
@@ -167,6 +233,66 @@ def batch(world_path: str, commands_file: click.File, origin: str) -> None:
         sys.exit(1)
 
 
+@main.command()
+@click.argument("world_path", type=click.Path(exists=True))
+@click.argument("script_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--origin", default="0,0,0", help="Origin for relative coords (x,y,z)")
+@click.option("--fold", is_flag=True, help="Collapse overlapping writes before applying")
+@cli_error_handler
+def execute_script(world_path: str, script_file: str, origin: str, fold: bool) -> None:
+    """Execute a whole command file in one pass.
+
+    Unlike batch, every line is parsed before the world is touched, and
+    writes are grouped by chunk. Any syntax error aborts the run.
+
+    Example:
+
+        mccommand execute-script ./my_world cabin_build.txt
+    """
+    origin_tuple = _parse_origin(origin)
+
+    from minecraft_holodeck.api import WorldEditor
+
+    with WorldEditor(world_path, origin_tuple) as editor:
+        count = editor.execute_script(script_file, fold=fold)
+        editor.save()
+        click.echo(f"✓ Modified {count} blocks")
+
+
+def _validate_batch(commands_file: str) -> None:
+    """Parse every command in a file without opening the world.
+
+    Args:
+        commands_file: Path to a file with one command per line
+
+    Raises:
+        SystemExit: If any line fails to parse
+    """
+    from minecraft_holodeck.parser import default_parser
+
+    parser = default_parser()
+    parsed = 0
+    errors = 0
+
+    with open(commands_file, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        for i, line in enumerate(f, 1):
+            line_str = line.strip()
+            if not line_str or line_str.startswith("#"):
+                continue
+
+            try:
+                parser.parse(line_str)
+                parsed += 1
+            except MCCommandError as e:
+                click.echo(f"Line {i} error: {e}", err=True)
+                errors += 1
+
+    click.echo(f"\n✓ Parsed {parsed} commands")
+    if errors:
+        click.echo(f"⚠ {errors} commands failed", err=True)
+        sys.exit(1)
+
+
 @main.command()
 @click.argument("command")
 @cli_error_handler
@@ -178,13 +304,11 @@ def parse(command: str) -> None:
         mccommand parse "/setblock 0 64 0 minecraft:stone"
     """
     import json
-    from dataclasses import asdict
 
-    from minecraft_holodeck.parser import CommandParser
+    from minecraft_holodeck.parser import default_parser
 
-    parser = CommandParser()
-    ast = parser.parse(command)
-    click.echo(json.dumps(asdict(ast), indent=2))
+    ast = default_parser().parse(command)
+    click.echo(json.dumps(_ast_to_jsonable(ast), indent=2))
 
 
 @main.command()
@@ -236,6 +360,8 @@ def create_flat(world_path: str, size: str, layers: str | None, name: str | None
             raise click.UsageError(f"Invalid layers format: {e}") from e
 
     # Create world
+    from minecraft_holodeck.world import create_flat_world
+
     click.echo(f"Creating flat world at {world_path}...")
     create_flat_world(
         world_path,
@@ -283,6 +409,8 @@ def create_void(
     size_chunks = _parse_size(size)
 
     # Create world
+    from minecraft_holodeck.world import create_void_world
+
     click.echo(f"Creating void world at {world_path}...")
     create_void_world(
         world_path,
@@ -297,8 +425,15 @@ def create_void(
 
 @main.command()
 @click.argument("script_file", type=click.Path(exists=True))
+@click.option(
+    "-j",
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes for parsing large scripts. Default: 1",
+)
 @cli_error_handler
-def analyze(script_file: str) -> None:
+def analyze(script_file: str, workers: int) -> None:
     """Analyze a build script to determine structure extents.
 
     Shows bounding box, dimensions, and placement calculations for
@@ -308,13 +443,15 @@ def analyze(script_file: str) -> None:
 
         mccommand analyze scripts/cabin_build.txt
     """
+    from minecraft_holodeck.converter import ScriptConverter
+
     script_path = Path(script_file)
 
     converter = ScriptConverter()
     click.echo(f"Analyzing {script_path}...")
     click.echo()
 
-    bbox = converter.analyze_script(script_path)
+    bbox = converter.analyze_script(script_path, n_workers=workers)
 
     click.echo("Structure Analysis:")
     click.echo(f"  {bbox}")
@@ -347,9 +484,26 @@ def analyze(script_file: str) -> None:
     is_flag=True,
     help="Don't auto-detect base point, use 0,0,0 instead",
 )
+@click.option(
+    "--merge",
+    is_flag=True,
+    help="Merge consecutive adjacent fills of the same block into one /fill",
+)
+@click.option(
+    "-j",
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes for parsing large scripts. Default: 1",
+)
 @cli_error_handler
 def convert_to_relative(
-    input_file: str, output: str | None, base: str | None, no_auto_detect: bool
+    input_file: str,
+    output: str | None,
+    base: str | None,
+    no_auto_detect: bool,
+    merge: bool,
+    workers: int,
 ) -> None:
     """Convert absolute coordinate script to relative coordinates.
 
@@ -366,6 +520,9 @@ def convert_to_relative(
 
         # Custom output filename
         mccommand convert-to-relative cabin_build.txt -o cabin_relative.txt
+
+        # Collapse rows of setblocks into fills
+        mccommand convert-to-relative cabin_build.txt --merge
     """
     input_path = Path(input_file)
 
@@ -378,12 +535,14 @@ def convert_to_relative(
         suffix = input_path.suffix
         output_path = input_path.parent / f"{stem}_relative{suffix}"
 
-    # Parse base point if provided (similar to origin but called "base")
+    # Parse base point if provided (same format as origin)
     base_point = None
     if base:
-        base_point = _parse_origin(base)  # Reuse origin parser for base
+        base_point = _parse_origin(base, label="base")
 
     # Convert script
+    from minecraft_holodeck.converter import ScriptConverter
+
     converter = ScriptConverter()
     click.echo(f"Converting {input_path} to relative coordinates...")
 
@@ -392,6 +551,8 @@ def convert_to_relative(
         output_path,
         base_point=base_point,
         auto_detect=not no_auto_detect,
+        merge=merge,
+        n_workers=workers,
     )
 
     click.echo("✓ Converted successfully")
@@ -0,0 +1,103 @@
+"""Compile a fixed command script into a reusable world-writing program.
+
+Template builds (a cabin, a plot border) run the same literal commands every
+time. Compiling does all the per-command work once: parsing, resolving
+coordinates, converting blocks, folding overlaps and splitting boxes by
+chunk. Running the result is then only palette lookups and array stores.
+"""
+
+from collections.abc import Callable, Iterable
+
+from amulet.api.block import Block  # type: ignore[import-untyped]
+
+from minecraft_holodeck.parser import CommandParser, SetblockCommand, default_parser
+from minecraft_holodeck.planner import FillOp, fold_writes
+from minecraft_holodeck.world import WorldModifier, blockspec_to_amulet
+from minecraft_holodeck.world.modifier import Region
+
+# A compiled script: applies its writes to a world, returns blocks modified
+Program = Callable[[WorldModifier], int]
+
+
+def compile_script(
+    commands: Iterable[str],
+    origin: tuple[int, int, int] = (0, 0, 0),
+    fold: bool = False,
+    parser: CommandParser | None = None,
+) -> Program:
+    """Compile commands into a function that applies them to a world.
+
+    Consecutive /setblock and replace/destroy /fill commands are
+    pre-split into per-chunk boxes. Other fill modes depend on shape or
+    on existing blocks, so they stay separate steps, run in order.
+
+    Args:
+        commands: Command strings, in execution order
+        origin: Origin point for relative coordinates
+        fold: Collapse overlapping writes to their final state first (see
+            :func:`minecraft_holodeck.planner.fold_writes`)
+        parser: Parser to use (defaults to the shared default_parser())
+
+    Returns:
+        Program taking a WorldModifier and returning blocks modified
+
+    Raises:
+        CommandSyntaxError: Invalid command syntax
+    """
+    parser = parser or default_parser()
+
+    ops: list[FillOp[Block]] = []
+    for command in commands:
+        ast = parser.parse(command)
+        block = blockspec_to_amulet(ast.block)
+        if isinstance(ast, SetblockCommand):
+            x, y, z = ast.position.resolve(origin)
+            ops.append((x, y, z, x, y, z, block, "replace"))
+        else:
+            x1, y1, z1 = ast.pos1.resolve(origin)
+            x2, y2, z2 = ast.pos2.resolve(origin)
+            ops.append((x1, y1, z1, x2, y2, z2, block, ast.mode))
+
+    if fold:
+        ops = fold_writes(ops, air=Block("minecraft", "air"))
+
+    steps: list[Program] = []
+    pending: list[Region] = []
+
+    for x1, y1, z1, x2, y2, z2, block, mode in ops:
+        if mode in ("replace", "destroy"):
+            pending.append((x1, y1, z1, x2, y2, z2, block))
+            continue
+        if pending:
+            steps.append(_plan_step(pending))
+            pending = []
+        steps.append(_fill_step((x1, y1, z1, x2, y2, z2, block, mode)))
+
+    if pending:
+        steps.append(_plan_step(pending))
+
+    def run(modifier: WorldModifier) -> int:
+        return sum(step(modifier) for step in steps)
+
+    return run
+
+
+def _plan_step(regions: list[Region]) -> Program:
+    """Precompute the chunk split of a group of box writes."""
+    plan, count = WorldModifier.plan_regions(regions)
+
+    def step(modifier: WorldModifier) -> int:
+        modifier.apply_plan(plan)
+        return count
+
+    return step
+
+
+def _fill_step(op: FillOp[Block]) -> Program:
+    """Wrap a fill whose result depends on the world it runs against."""
+    x1, y1, z1, x2, y2, z2, block, mode = op
+
+    def step(modifier: WorldModifier) -> int:
+        return modifier.fill_region(x1, y1, z1, x2, y2, z2, block, mode)
+
+    return step
@@ -1,33 +1,67 @@
 """Convert absolute coordinate scripts to relative coordinates."""
 
+import multiprocessing
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Iterator, TextIO
+from typing import Any
 
-from minecraft_holodeck.parser import CommandParser, FillCommand, SetblockCommand
-from minecraft_holodeck.parser.ast import BlockSpec, Coordinate, Position
+import numpy as np
+
+from minecraft_holodeck.parser import (
+    CommandParser,
+    FillCommand,
+    SetblockCommand,
+    default_parser,
+)
+from minecraft_holodeck.parser.ast import (
+    BlockSpec,
+    Coordinate,
+    Position,
+    StateValue,
+    TypedBlockStates,
+    typed_states,
+)
+
+Command = SetblockCommand | FillCommand
+
+# Coordinate bounds: ((min_x, min_y, min_z), (max_x, max_y, max_z))
+Bounds = tuple[tuple[float, float, float], tuple[float, float, float]]
+
+# Fill modes whose merged box writes exactly what the two parts wrote
+MERGEABLE_MODES = frozenset({"replace", "destroy"})
+
+
+# Per-type position getters and command names, looked up by type(ast)
+_POSITION_GETTERS: dict[type[Command], Callable[[Any], tuple[Position, ...]]] = {
+    SetblockCommand: lambda ast: (ast.position,),
+    FillCommand: lambda ast: (ast.pos1, ast.pos2),
+}
+_COMMAND_NAMES: dict[type[Command], str] = {
+    SetblockCommand: "/setblock",
+    FillCommand: "/fill",
+}
 
 
 def _extract_positions_from_command(
     ast: SetblockCommand | FillCommand,
-) -> Iterator[Position]:
+) -> tuple[Position, ...]:
     """Extract all positions from a parsed command.
 
     Args:
         ast: Parsed command (SetblockCommand or FillCommand)
 
-    Yields:
-        Position objects from the command
+    Returns:
+        Position objects from the command, in order
     """
-    if isinstance(ast, SetblockCommand):
-        yield ast.position
-    elif isinstance(ast, FillCommand):
-        yield ast.pos1
-        yield ast.pos2
+    return _POSITION_GETTERS[type(ast)](ast)
 
 
 def _compute_coordinate_bounds(
-    commands: Iterator[tuple[SetblockCommand | FillCommand | None, ...]],
+    commands: Iterable[tuple[Any, ...]],
 ) -> tuple[
     tuple[float, float, float],  # min_x, min_y, min_z
     tuple[float, float, float],  # max_x, max_y, max_z
@@ -35,19 +69,18 @@ def _compute_coordinate_bounds(
     """Compute coordinate bounds from a sequence of commands.
 
     Args:
-        commands: Iterator of tuples containing command ASTs (can include None values)
+        commands: Tuples whose last item is a command AST or None
 
     Returns:
         Tuple of (min_coords, max_coords) where each is (x, y, z)
         Uses float('inf') and float('-inf') if no coordinates found
     """
-    min_x = float("inf")
-    min_y = float("inf")
-    min_z = float("inf")
-    max_x = float("-inf")
-    max_y = float("-inf")
-    max_z = float("-inf")
+    inf = float("inf")
+    min_x = min_y = min_z = inf
+    max_x = max_y = max_z = -inf
 
+    # Six running scalars with inline compares: constant memory while the
+    # script streams past, and no min()/max() call per coordinate
     for item in commands:
         # Handle both tuple format (from convert_file) and direct AST
         ast = item[-1] if isinstance(item, tuple) else item
@@ -56,20 +89,373 @@ def _compute_coordinate_bounds(
 
         for pos in _extract_positions_from_command(ast):
             # Only consider absolute coordinates
-            if not pos.x.relative:
-                min_x = min(min_x, pos.x.value)
-                max_x = max(max_x, pos.x.value)
-            if not pos.y.relative:
-                min_y = min(min_y, pos.y.value)
-                max_y = max(max_y, pos.y.value)
-            if not pos.z.relative:
-                min_z = min(min_z, pos.z.value)
-                max_z = max(max_z, pos.z.value)
+            x, y, z = pos.x, pos.y, pos.z
+            if not x.relative:
+                v = x.value
+                if v < min_x:
+                    min_x = v
+                if v > max_x:
+                    max_x = v
+            if not y.relative:
+                v = y.value
+                if v < min_y:
+                    min_y = v
+                if v > max_y:
+                    max_y = v
+            if not z.relative:
+                v = z.value
+                if v < min_z:
+                    min_z = v
+                if v > max_z:
+                    max_z = v
+
+    return (
+        (float(min_x), float(min_y), float(min_z)),
+        (float(max_x), float(max_y), float(max_z)),
+    )
+
+
+# Plain absolute /setblock and /fill lines without block states, which
+# generated scripts are mostly made of, are converted as text without
+# building an AST (the parser has its own fast path for the AST). re.ASCII
+# keeps \d and \s to the ASCII digits and whitespace the grammar accepts.
+_INT = r"([+-]?\d+)"
+_BLOCK = r"(?:([a-z][a-z0-9_/]*):)?([a-z][a-z0-9_/]*)"
+_FAST_SETBLOCK_RE = re.compile(
+    rf"/?setblock\s+{_INT}\s+{_INT}\s+{_INT}\s+{_BLOCK}", re.ASCII
+)
+_FAST_FILL_RE = re.compile(
+    r"/?fill" + rf"\s+{_INT}" * 6 + rf"\s+{_BLOCK}"
+    r"(?:\s+(destroy|hollow|keep|outline|replace))?",
+    re.ASCII,
+)
+
+
+# One whole plain absolute /setblock line (coordinates captured only), for
+# scanning a block of lines at once when only bounds are needed; (?a) keeps
+# \d to ASCII digits like the fast-path regexes above
+_PLAIN_SETBLOCK_LINE_RE = re.compile(
+    rf"(?am)^[ \t]*/?setblock[ \t]+{_INT}[ \t]+{_INT}[ \t]+{_INT}[ \t]+"
+    r"(?:[a-z][a-z0-9_/]*:)?[a-z][a-z0-9_/]*[ \t\r]*$"
+)
+
+
+def _fast_match(line: str) -> tuple[list[int], str, str, str] | None:
+    """Match a plain absolute command without running the parser.
+
+    Args:
+        line: Stripped command line
+
+    Returns:
+        (coordinates, namespace, block_id, mode), or None if the line needs
+        the full parser (relative coordinates, block states, odd spacing)
+    """
+    match = _FAST_SETBLOCK_RE.fullmatch(line) or _FAST_FILL_RE.fullmatch(line)
+    if match is None:
+        return None
+    groups = match.groups()
+    n = 3 if match.re is _FAST_SETBLOCK_RE else 6
+    mode = groups[n + 2] if n == 6 else None
+    return (
+        [int(value) for value in groups[:n]],
+        groups[n] or "minecraft",
+        groups[n + 1],
+        mode or "replace",
+    )
+
+
+def _fast_convert(line: str, base_point: tuple[int, int, int]) -> str | None:
+    """Convert a plain absolute command line straight to relative text.
 
-    return (min_x, min_y, min_z), (max_x, max_y, max_z)
+    Args:
+        line: Stripped command line
+        base_point: Base point (x, y, z)
+
+    Returns:
+        Converted line, or None if the line needs the full parser
+    """
+    fast = _fast_match(line)
+    if fast is None:
+        return None
+
+    coords, namespace, block_id, mode = fast
+    offsets = " ".join(
+        _format_offset(value - base_point[axis % 3])
+        for axis, value in enumerate(coords)
+    )
+    name = "setblock" if len(coords) == 3 else "fill"
+    command = f"/{name} {offsets} {namespace}:{block_id}"
+    return command if mode == "replace" else f"{command} {mode}"
+
+
+def _iter_blocks(script_path: Path) -> Iterator[tuple[int, list[str]]]:
+    """Stream a script in blocks of about READ_BLOCK_SIZE bytes.
+
+    Args:
+        script_path: Path to script file
+
+    Yields:
+        (line number of the block's first line, raw lines) tuples
+    """
+    first_line = 1
+    with open(script_path, buffering=READ_BLOCK_SIZE) as f:
+        while block := f.readlines(READ_BLOCK_SIZE):
+            yield (first_line, block)
+            first_line += len(block)
 
 
-@dataclass
+def _iter_lines(script_path: Path) -> Iterator[str]:
+    """Stream the stripped lines of a script.
+
+    Args:
+        script_path: Path to script file
+
+    Yields:
+        Each line with surrounding whitespace removed
+    """
+    # Split a block at a time in C, keeping memory bounded
+    for _, block in _iter_blocks(script_path):
+        yield from [raw.strip() for raw in block]
+
+
+def _plain_block_bounds(lines: list[str]) -> Bounds | None:
+    """Bound a block of lines without parsing, if all are plain setblocks.
+
+    Generated scripts are often nothing but absolute /setblock lines. For
+    those one regex scan pulls every coordinate out of the block and NumPy
+    reduces them, skipping an AST per line.
+
+    Args:
+        lines: Raw script lines, as from _iter_blocks
+
+    Returns:
+        Bounds of the block, or None if any command line in it is not a
+        plain absolute /setblock (or there are none), so the caller parses
+    """
+    text = "".join(lines)
+    # Cheap rejection of blocks that hold fills, relative coordinates or
+    # states, before paying for the scan
+    if "fill" in text or "~" in text or "[" in text:
+        return None
+    coords = _PLAIN_SETBLOCK_LINE_RE.findall(text)
+    if not coords:
+        return None
+    n_commands = sum(1 for raw in lines if (line := raw.lstrip()) and line[0] != "#")
+    if len(coords) != n_commands:
+        return None
+
+    try:
+        array = np.array(coords, dtype=np.int64)
+    except OverflowError:
+        return None
+    lo, hi = array.min(axis=0).tolist(), array.max(axis=0).tolist()
+    return (
+        (float(lo[0]), float(lo[1]), float(lo[2])),
+        (float(hi[0]), float(hi[1]), float(hi[2])),
+    )
+
+
+def _block_bounds(task: tuple[int, list[str], bool]) -> tuple[Bounds, list[str]]:
+    """Parse a block of script lines and return their coordinate bounds.
+
+    Runs in a worker process, so it parses with the worker's
+    default_parser() and sends back six floats rather than ASTs. Warnings
+    are sent back too, for the parent to print in line order.
+
+    Args:
+        task: (line number of the first line, raw lines, warn on bad lines)
+
+    Returns:
+        Tuple of (bounds of the block, as from _compute_coordinate_bounds,
+        and warning messages for lines that failed to parse)
+    """
+    first_line, lines, warn = task
+    warnings: list[str] = []
+    plain = _plain_block_bounds(lines)
+    if plain is not None:
+        return plain, warnings
+    parser = default_parser()
+
+    def parsed() -> Iterator[tuple[SetblockCommand | FillCommand]]:
+        for line_num, raw in enumerate(lines, first_line):
+            line = raw.strip()
+            if not line or line[0] == "#":
+                continue
+            try:
+                yield (parser.parse(line),)
+            except Exception as e:
+                if warn:
+                    warnings.append(f"Warning: Could not parse line {line_num}: {e}")
+
+    return _compute_coordinate_bounds(parsed()), warnings
+
+
+def _print_warnings(results: Iterable[tuple[Bounds, list[str]]]) -> Iterator[Bounds]:
+    """Print the warnings from _block_bounds results and pass on the bounds.
+
+    Args:
+        results: (bounds, warnings) per block, in input order
+
+    Yields:
+        Bounds of each block
+    """
+    for bounds, warnings in results:
+        for warning in warnings:
+            print(warning)
+        yield bounds
+
+
+def _convert_block(task: tuple[list[str], tuple[int, int, int]]) -> str:
+    """Convert a block of script lines to relative coordinates.
+
+    Runs in a worker process, with a converter shared by every block the
+    worker handles.
+
+    Args:
+        task: (raw lines, base point)
+
+    Returns:
+        The converted lines, newline-terminated and joined
+    """
+    lines, base_point = task
+    converted = _worker_converter()._convert_lines(
+        [raw.strip() for raw in lines], base_point
+    )
+    return "".join([line + "\n" for line in converted])
+
+
+@cache
+def _worker_converter() -> "ScriptConverter":
+    """Return the converter used by _convert_block in this process."""
+    return ScriptConverter()
+
+
+def _merge_bounds(parts: Iterable[Bounds]) -> Bounds:
+    """Combine the bounds of several blocks into one.
+
+    Args:
+        parts: Bounds from _compute_coordinate_bounds or _block_bounds
+
+    Returns:
+        Per-axis minimum of the mins and maximum of the maxes
+    """
+    inf = float("inf")
+    mins = [inf, inf, inf]
+    maxs = [-inf, -inf, -inf]
+    for part_min, part_max in parts:
+        for axis in range(3):
+            mins[axis] = min(mins[axis], part_min[axis])
+            maxs[axis] = max(maxs[axis], part_max[axis])
+    return (mins[0], mins[1], mins[2]), (maxs[0], maxs[1], maxs[2])
+
+
+def _command_box(
+    ast: Command,
+) -> tuple[tuple[int, int, int], tuple[int, int, int]] | None:
+    """Return the (min, max) corners of an absolute replace-style command.
+
+    Args:
+        ast: Parsed command
+
+    Returns:
+        Inclusive corners, or None if the command cannot be merged
+        (relative coordinates or a shape/world-dependent fill mode)
+    """
+    # A setblock's single position is both corners of its box
+    if ast.mode not in MERGEABLE_MODES:
+        return None
+    positions = _extract_positions_from_command(ast)
+    corners = (positions[0], positions[-1])
+
+    coords = [c for pos in corners for c in (pos.x, pos.y, pos.z)]
+    if any(c.relative for c in coords):
+        return None
+    x1, y1, z1, x2, y2, z2 = (c.value for c in coords)
+    return (
+        (min(x1, x2), min(y1, y2), min(z1, z2)),
+        (max(x1, x2), max(y1, y2), max(z1, z2)),
+    )
+
+
+def _merge_commands(first: Command, second: Command) -> FillCommand | None:
+    """Merge two commands into one fill if their boxes join face to face.
+
+    The boxes must write the same block in the same mode, match on two
+    axes, and touch on the third. States are compared with their types,
+    since BlockSpec equality treats [powered=true] and [powered=1] as equal.
+
+    Args:
+        first: Earlier command
+        second: Command directly after it
+
+    Returns:
+        Single fill covering both boxes, or None if they can't be merged
+    """
+    if first.block != second.block or first.mode != second.mode:
+        return None
+    if typed_states(first.block.states) != typed_states(second.block.states):
+        return None
+    box_a = _command_box(first)
+    box_b = _command_box(second)
+    if box_a is None or box_b is None:
+        return None
+
+    (a_min, a_max), (b_min, b_max) = box_a, box_b
+    differing = [
+        axis for axis in range(3)
+        if (a_min[axis], a_max[axis]) != (b_min[axis], b_max[axis])
+    ]
+    if len(differing) != 1:
+        return None
+    axis = differing[0]
+    if a_max[axis] + 1 != b_min[axis] and b_max[axis] + 1 != a_min[axis]:
+        return None
+
+    low = tuple(min(a, b) for a, b in zip(a_min, b_min))
+    high = tuple(max(a, b) for a, b in zip(a_max, b_max))
+    return FillCommand(
+        pos1=Position(*(Coordinate(v) for v in low)),
+        pos2=Position(*(Coordinate(v) for v in high)),
+        block=first.block,
+        mode=first.mode,
+    )
+
+
+def _merge_runs(
+    entries: Iterable[tuple[str, Command | None]],
+) -> Iterator[tuple[str, Command | None]]:
+    """Merge consecutive adjacent fills in a stream of (line, ast) entries.
+
+    Only neighbours are merged, so the order of writes is unchanged. An
+    entry without an AST (comment, blank or bad line) ends the current run.
+
+    Args:
+        entries: (original line, parsed command or None) pairs
+
+    Yields:
+        Entries with merged runs collapsed into one fill
+    """
+    pending: tuple[str, Command] | None = None
+
+    for line, ast in entries:
+        if ast is not None and pending is not None:
+            merged = _merge_commands(pending[1], ast)
+            if merged is not None:
+                pending = (line, merged)
+                continue
+        if pending is not None:
+            yield pending
+            pending = None
+        if ast is None:
+            yield (line, None)
+        else:
+            pending = (line, ast)
+
+    if pending is not None:
+        yield pending
+
+
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
     """Bounding box of a structure."""
 
@@ -104,6 +490,25 @@ class BoundingBox:
             int(max_x), int(max_y), int(max_z),
         )
 
+    @classmethod
+    def from_bounds(
+        cls,
+        min_coords: tuple[float, float, float],
+        max_coords: tuple[float, float, float],
+    ) -> "BoundingBox":
+        """Create a BoundingBox from _compute_coordinate_bounds output.
+
+        Args:
+            min_coords: (min_x, min_y, min_z), infinite if nothing was found
+            max_coords: (max_x, max_y, max_z)
+
+        Returns:
+            BoundingBox, or an empty one if no coordinates were found
+        """
+        if min_coords[0] == float("inf"):
+            return cls.empty()
+        return cls.from_min_max(*min_coords, *max_coords)
+
     @classmethod
     def empty(cls) -> "BoundingBox":
         """Create an empty bounding box at the origin.
@@ -136,49 +541,107 @@ class BoundingBox:
         )
 
 
+# Offsets within this distance of the base point use precomputed strings
+COORD_TABLE_RANGE = 1024
+
+# Distinct offsets beyond the table whose strings are kept
+FAR_OFFSET_CACHE_SIZE = 4096
+
+
+def _build_offset(offset: int) -> str:
+    """Format an offset without a table lookup."""
+    if offset == 0:
+        return "~"
+    if offset > 0:
+        return f"~+{offset}"
+    return f"~{offset}"  # Negative already has its '-'
+
+
+_COORD_STRINGS: dict[int, str] = {
+    n: _build_offset(n) for n in range(-COORD_TABLE_RANGE, COORD_TABLE_RANGE + 1)
+}
+
+# Far-off structures (an absolute script converted against a distant base)
+# repeat the same few large offsets; format each one once
+_format_far_offset = lru_cache(maxsize=FAR_OFFSET_CACHE_SIZE)(_build_offset)
+
+
+def _format_offset(offset: int) -> str:
+    """Format a relative offset like "~", "~+5" or "~-3".
+
+    Args:
+        offset: Offset from the base point
+
+    Returns:
+        Relative coordinate string
+    """
+    text = _COORD_STRINGS.get(offset)
+    return text if text is not None else _format_far_offset(offset)
+
+
+# Distinct block specs whose formatted strings are kept
+BLOCK_FORMAT_CACHE_SIZE = 4096
+
+
+def _format_state_value(value: StateValue) -> str:
+    """Format a state value the way the grammar reads it back."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+@lru_cache(maxsize=BLOCK_FORMAT_CACHE_SIZE)
+def _format_block_spec(block: BlockSpec, typed: TypedBlockStates | None) -> str:
+    """Format a block spec to string, memoized per spec.
+
+    BlockSpec is frozen with states sorted by key, so equal specs hash
+    equal and scripts that repeat a handful of blocks format each once.
+    BlockSpec equality treats True as 1, so the typed states are part of
+    the key to keep [powered=true] and [powered=1] apart.
+
+    Args:
+        block: BlockSpec to format
+        typed: typed_states(block.states)
+
+    Returns:
+        Block string like "minecraft:stone" or "oak_stairs[facing=north]"
+    """
+    if not block.states:
+        return block.full_id
+    states = ",".join(f"{k}={_format_state_value(v)}" for k, v in block.states)
+    return f"{block.full_id}[{states}]"
+
+
+# Scripts are read and split into lines in blocks of about 1 MiB
+READ_BLOCK_SIZE = 1 << 20
+
+# Below this file size a worker pool costs more to start than it saves
+PARALLEL_MIN_BYTES = 8 << 20
+
+# Scripts are parsed whole, so keep every distinct line of a large script
+CONVERTER_PARSE_CACHE_SIZE = 100_000
+
+
 class ScriptConverter:
     """Convert absolute coordinate build scripts to relative coordinates."""
 
-    def __init__(self):
-        self.parser = CommandParser()
+    def __init__(self) -> None:
+        self.parser = CommandParser(cache_size=CONVERTER_PARSE_CACHE_SIZE)
 
-    def analyze_script(self, script_path: Path | str) -> BoundingBox:
+    def analyze_script(
+        self, script_path: Path | str, n_workers: int = 1
+    ) -> BoundingBox:
         """Analyze a script to determine its bounding box.
 
         Args:
             script_path: Path to script file
+            n_workers: Worker processes for parsing (see :meth:`_bounds`)
 
         Returns:
             BoundingBox containing structure extents
         """
-        script_path = Path(script_path)
-
-        # Parse all commands from file
-        def _parse_commands():
-            with open(script_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    try:
-                        yield (self.parser.parse(line),)
-                    except Exception:
-                        # Skip unparseable lines
-                        continue
-
-        # Compute bounds using shared helper
-        (min_x, min_y, min_z), (max_x, max_y, max_z) = _compute_coordinate_bounds(
-            _parse_commands()
-        )
-
-        # If no coordinates found, return empty bounding box
-        if min_x == float("inf"):
-            return BoundingBox.empty()
-
-        return BoundingBox.from_min_max(
-            min_x, min_y, min_z,
-            max_x, max_y, max_z,
-        )
+        # Unparseable lines are skipped
+        return BoundingBox.from_bounds(*self._bounds(Path(script_path), n_workers))
 
     def convert_file(
         self,
@@ -186,6 +649,8 @@ class ScriptConverter:
         output_path: Path | str,
         base_point: tuple[int, int, int] | None = None,
         auto_detect: bool = True,
+        merge: bool = False,
+        n_workers: int = 1,
     ) -> tuple[tuple[int, int, int], BoundingBox]:
         """Convert a script file from absolute to relative coordinates.
 
@@ -195,6 +660,9 @@ class ScriptConverter:
             base_point: Base point for relative coordinates (x, y, z).
                        If None and auto_detect is True, uses minimum coordinates.
             auto_detect: If True, automatically detect base point from min coords
+            merge: Merge consecutive adjacent fills (see :meth:`optimize_fills`)
+            n_workers: Worker processes for large scripts (see :meth:`_bounds`);
+                without merge, the conversion pass uses them too
 
         Returns:
             Tuple of (base_point, bounding_box)
@@ -202,73 +670,200 @@ class ScriptConverter:
         input_path = Path(input_path)
         output_path = Path(output_path)
 
-        # Read and parse all commands
-        commands = []
-        with open(input_path) as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    commands.append((line_num, line, None))  # Keep comments/blanks
-                else:
-                    try:
-                        ast = self.parser.parse(line)
-                        commands.append((line_num, line, ast))
-                    except Exception as e:
-                        print(f"Warning: Could not parse line {line_num}: {e}")
-                        commands.append((line_num, line, None))
+        # Pass 1: stream the file once for both bbox and base point
+        min_coords, max_coords = self._bounds(input_path, n_workers, warn=True)
+        bbox = BoundingBox.from_bounds(min_coords, max_coords)
 
         # Determine base point
         if base_point is None and auto_detect:
-            base_point = self._detect_base_point(commands)
+            base_point = self._detect_base_point(min_coords)
         elif base_point is None:
             base_point = (0, 0, 0)
 
-        # Compute bounding box from original script
-        bbox = self.analyze_script(input_path)
+        # Header goes out in one write; the bbox string spans two lines
+        extents = "\n".join(f"#   {line}" for line in str(bbox).splitlines())
+        bx, by, bz = base_point
+        header = (
+            "# Converted to relative coordinates\n"
+            f"# Base point: {bx}, {by}, {bz}\n"
+            "#\n"
+            "# Structure extents:\n"
+            f"{extents}\n"
+            "#\n"
+            "# For base-to-base placement (e.g., 10 blocks east):\n"
+            f"#   Cabin 1: --origin {bx},{by},{bz}\n"
+            f"#   Cabin 2: --origin {bx + bbox.width + 10},{by},{bz} "
+            f"(width={bbox.width}, gap=10)\n"
+            "#\n"
+            "# Basic usage:\n"
+            f"#   mccommand batch world {output_path.name} --origin {bx},{by},{bz}\n"
+            "\n"
+        )
 
-        # Convert and write
         with open(output_path, "w") as f:
-            f.write(f"# Converted to relative coordinates\n")
-            f.write(f"# Base point: {base_point[0]}, {base_point[1]}, {base_point[2]}\n")
-            f.write(f"#\n")
-            f.write(f"# Structure extents:\n")
-            f.write(f"#   {bbox}\n")
-            f.write(f"#\n")
-            f.write(f"# For base-to-base placement (e.g., 10 blocks east):\n")
-            f.write(f"#   Cabin 1: --origin {base_point[0]},{base_point[1]},{base_point[2]}\n")
-            f.write(
-                f"#   Cabin 2: --origin {base_point[0] + bbox.width + 10},{base_point[1]},{base_point[2]} "
-                f"(width={bbox.width}, gap=10)\n"
-            )
-            f.write(f"#\n")
-            f.write(f"# Basic usage:\n")
-            f.write(f"#   mccommand batch world {output_path.name} --origin {base_point[0]},{base_point[1]},{base_point[2]}\n")
-            f.write("\n")
-
-            for line_num, original_line, ast in commands:
-                if ast is None:
-                    # Keep comments and blank lines as-is
-                    f.write(original_line + "\n")
-                else:
-                    # Convert to relative
-                    converted = self._convert_command(ast, base_point)
-                    f.write(converted + "\n")
+            f.write(header)
+            # Pass 2: stream again, converting line by line; repeated lines
+            # come from the parser cache rather than being parsed again.
+            # writelines drains the generator through the file buffer
+            # without a write() call per line.
+            lines: Iterable[str]
+            if merge:
+                lines = (
+                    original_line if ast is None
+                    else self._convert_command(ast, base_point)
+                    for original_line, ast in _merge_runs(
+                        (line, ast) for _, line, ast in self._iter_commands(input_path)
+                    )
+                )
+                f.writelines(line + "\n" for line in lines)
+            elif n_workers > 1 and os.path.getsize(input_path) >= PARALLEL_MIN_BYTES:
+                # Blocks convert independently; imap keeps them in order
+                with multiprocessing.Pool(n_workers) as pool:
+                    f.writelines(pool.imap(
+                        _convert_block,
+                        ((block, base_point) for _, block in _iter_blocks(input_path)),
+                    ))
+            else:
+                lines = self._convert_lines(_iter_lines(input_path), base_point)
+                f.writelines(line + "\n" for line in lines)
 
         return base_point, bbox
 
+    def optimize_fills(self, commands: Iterable[Command]) -> list[Command]:
+        """Merge consecutive commands whose boxes join into larger fills.
+
+        Generated scripts often write a wall or floor as a row of setblocks
+        or thin fills. Neighbouring commands with the same block and mode
+        whose boxes share a face become a single /fill; this repeats, so a
+        row of setblocks collapses into one command. Only absolute
+        replace/destroy commands are merged, and only with the command
+        directly after them, so the final world is unchanged.
+
+        Args:
+            commands: Parsed commands in script order
+
+        Returns:
+            Commands with adjacent runs merged
+        """
+        return [
+            ast for _, ast in _merge_runs(("", c) for c in commands)
+            if ast is not None
+        ]
+
+    def _bounds(self, script_path: Path, n_workers: int, warn: bool = False) -> Bounds:
+        """Compute the coordinate bounds of a script, in parallel if worthwhile.
+
+        Each line parses independently, so with n_workers > 1 and a script
+        of at least PARALLEL_MIN_BYTES, blocks of lines are parsed in a
+        process pool and only their bounds and warnings come back; the
+        warnings are printed here, in line order. Smaller scripts, or
+        n_workers of 1, are parsed here with the converter's cached parser.
+        Either way, blocks of only plain absolute /setblock lines are
+        bounded by _plain_block_bounds without parsing.
+
+        Args:
+            script_path: Path to script file
+            n_workers: Worker processes to use
+            warn: Print a warning for each line that fails to parse
+
+        Returns:
+            Coordinate bounds, as from _compute_coordinate_bounds
+        """
+        if n_workers <= 1 or os.path.getsize(script_path) < PARALLEL_MIN_BYTES:
+            return _merge_bounds(
+                _plain_block_bounds(block)
+                or _compute_coordinate_bounds(self._parse_block(first_line, block, warn))
+                for first_line, block in _iter_blocks(script_path)
+            )
+
+        with multiprocessing.Pool(n_workers) as pool:
+            # imap keeps blocks in order, so warnings print in line order
+            return _merge_bounds(_print_warnings(pool.imap(
+                _block_bounds,
+                ((first_line, block, warn) for first_line, block in _iter_blocks(script_path)),
+            )))
+
+    def _iter_commands(
+        self, script_path: Path, warn: bool = False
+    ) -> Iterator[tuple[int, str, SetblockCommand | FillCommand | None]]:
+        """Stream a script as (line_num, line, ast) tuples.
+
+        Comments, blank lines and unparseable lines have ast None.
+
+        Args:
+            script_path: Path to script file
+            warn: Print a warning for each line that fails to parse
+
+        Yields:
+            Tuples of (line number, stripped line, parsed command or None)
+        """
+        for first_line, block in _iter_blocks(script_path):
+            yield from self._parse_block(first_line, block, warn)
+
+    def _parse_block(
+        self, first_line: int, lines: list[str], warn: bool = False
+    ) -> Iterator[tuple[int, str, SetblockCommand | FillCommand | None]]:
+        """Parse a block of raw lines, as _iter_commands does for a file.
+
+        Args:
+            first_line: Line number of the block's first line
+            lines: Raw script lines, as from _iter_blocks
+            warn: Print a warning for each line that fails to parse
+
+        Yields:
+            Tuples of (line number, stripped line, parsed command or None)
+        """
+        stripped = [raw.strip() for raw in lines]
+        for line_num, line in enumerate(stripped, first_line):
+            if not line or line[0] == "#":
+                yield (line_num, line, None)  # Keep comments/blanks
+                continue
+            try:
+                yield (line_num, line, self.parser.parse(line))
+            except Exception as e:
+                if warn:
+                    print(f"Warning: Could not parse line {line_num}: {e}")
+                yield (line_num, line, None)
+
+    def _convert_lines(
+        self, lines: Iterable[str], base_point: tuple[int, int, int]
+    ) -> Iterator[str]:
+        """Convert stripped script lines, without merging.
+
+        Plain absolute lines are converted by _fast_convert; everything
+        else goes through the parser (and its cache).
+
+        Args:
+            lines: Stripped script lines, as from _iter_lines
+            base_point: Base point (x, y, z)
+
+        Yields:
+            Converted command lines, and other lines unchanged
+        """
+        for line in lines:
+            if not line or line[0] == "#":
+                yield line
+                continue
+            converted = _fast_convert(line, base_point)
+            if converted is None:
+                try:
+                    converted = self._convert_command(self.parser.parse(line), base_point)
+                except Exception:
+                    converted = line  # Already warned about in pass 1
+            yield converted
+
     def _detect_base_point(
-        self, commands: list[tuple[int, str, SetblockCommand | FillCommand | None]]
+        self, min_coords: tuple[float, float, float]
     ) -> tuple[int, int, int]:
         """Detect base point from minimum coordinates in commands.
 
         Args:
-            commands: List of (line_num, line, ast) tuples
+            min_coords: Minimum (x, y, z) from _compute_coordinate_bounds
 
         Returns:
             Base point (min_x, min_y, min_z)
         """
-        # Use shared helper to compute bounds (only need min values)
-        (min_x, min_y, min_z), _ = _compute_coordinate_bounds(iter(commands))
+        min_x, min_y, min_z = min_coords
 
         # If no coordinates found, use origin
         if min_x == float("inf"):
@@ -288,63 +883,19 @@ class ScriptConverter:
         Returns:
             Command string with relative coordinates
         """
-        if isinstance(ast, SetblockCommand):
-            pos_str = self._convert_position(ast.position, base_point)
-            block_str = self._format_block(ast.block)
-            return f"/setblock {pos_str} {block_str}"
-
-        elif isinstance(ast, FillCommand):
-            pos1_str = self._convert_position(ast.pos1, base_point)
-            pos2_str = self._convert_position(ast.pos2, base_point)
-            block_str = self._format_block(ast.block)
-            if ast.mode == "replace":
-                return f"/fill {pos1_str} {pos2_str} {block_str}"
-            else:
-                return f"/fill {pos1_str} {pos2_str} {block_str} {ast.mode}"
-
-        return ""
-
-    def _convert_position(
-        self, pos: Position, base_point: tuple[int, int, int]
-    ) -> str:
-        """Convert a position to relative coordinate string.
-
-        Args:
-            pos: Position to convert
-            base_point: Base point (x, y, z)
-
-        Returns:
-            Position string like "~0 ~5 ~-3"
-        """
-        x_str = self._convert_coord(pos.x, base_point[0])
-        y_str = self._convert_coord(pos.y, base_point[1])
-        z_str = self._convert_coord(pos.z, base_point[2])
-        return f"{x_str} {y_str} {z_str}"
-
-    def _convert_coord(self, coord: Coordinate, base: int) -> str:
-        """Convert a coordinate to relative string.
-
-        Args:
-            coord: Coordinate to convert
-            base: Base coordinate value
-
-        Returns:
-            Coordinate string like "~5" or "~0" or "~-3"
-        """
-        if coord.relative:
-            # Already relative, keep as-is
-            if coord.value == 0:
-                return "~"
-            else:
-                return f"~{coord.value:+d}".replace("+-", "-")
-        else:
-            # Convert absolute to relative
-            offset = coord.value - base
-            if offset == 0:
-                return "~"
-            else:
-                # Format with explicit sign
-                return f"~{offset:+d}".replace("+-", "-")
+        # Gather every token, then join once: no per-position strings
+        bx, by, bz = base_point
+        parts = [_COMMAND_NAMES[type(ast)]]
+        for pos in _extract_positions_from_command(ast):
+            x, y, z = pos.x, pos.y, pos.z
+            # Relative coordinates keep their offset; absolute ones move
+            parts.append(_format_offset(x.value if x.relative else x.value - bx))
+            parts.append(_format_offset(y.value if y.relative else y.value - by))
+            parts.append(_format_offset(z.value if z.relative else z.value - bz))
+        parts.append(self._format_block(ast.block))
+        if ast.mode != "replace":
+            parts.append(ast.mode)
+        return " ".join(parts)
 
     def _format_block(self, block: BlockSpec) -> str:
         """Format a block spec to string.
@@ -355,10 +906,4 @@ class ScriptConverter:
         Returns:
             Block string like "minecraft:stone" or "oak_stairs[facing=north]"
         """
-        result = block.full_id
-
-        if block.states:
-            state_pairs = [f"{k}={v}" for k, v in block.states.items()]
-            result += "[" + ",".join(state_pairs) + "]"
-
-        return result
+        return _format_block_spec(block, typed_states(block.states))
@@ -1,4 +1,12 @@
-"""Command parser module."""
+"""Command parser module.
+
+The AST types are plain dataclasses; CommandParser and default_parser are
+loaded on first access, so code that only needs the types (such as the
+block converter) does not import Lark.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from minecraft_holodeck.exceptions import CommandSyntaxError
 from minecraft_holodeck.parser.ast import (
@@ -9,10 +17,13 @@ from minecraft_holodeck.parser.ast import (
     Position,
     SetblockCommand,
 )
-from minecraft_holodeck.parser.parser import CommandParser
+
+if TYPE_CHECKING:
+    from minecraft_holodeck.parser.parser import CommandParser, default_parser
 
 __all__ = [
     "CommandParser",
+    "default_parser",
     "CommandSyntaxError",
     "CommandAST",
     "SetblockCommand",
@@ -21,3 +32,18 @@ __all__ = [
     "Coordinate",
     "BlockSpec",
 ]
+
+# Attribute name -> module that defines it, imported on first access
+_LAZY_ATTRS = {
+    "CommandParser": "minecraft_holodeck.parser.parser",
+    "default_parser": "minecraft_holodeck.parser.parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Lark-backed parser on first use."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
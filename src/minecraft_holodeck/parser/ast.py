@@ -1,10 +1,24 @@
-"""AST data structures for Minecraft commands."""
+"""AST data structures for Minecraft commands.
+
+All nodes are frozen: CommandParser caches parse results, so the same AST
+object may be handed to several callers. They are also slotted, since large
+scripts hold many of them at once.
+"""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
+# Block state value after type conversion: "north", 3, True
+StateValue = str | int | bool
+
+# Block states as (key, value) pairs sorted by key
+BlockStates = tuple[tuple[str, StateValue], ...]
+
+FillMode = Literal["replace", "destroy", "hollow", "keep", "outline"]
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Coordinate:
     """Single coordinate (x, y, or z).
 
@@ -27,7 +41,32 @@ class Coordinate:
         return origin + self.value if self.relative else self.value
 
 
-@dataclass
+# Shared coordinates for values in the overworld build height range, which
+# covers nearly every y and most offsets and small x/z values
+SHARED_COORDINATES = range(-64, 320)
+_ABSOLUTE_COORDINATES = {v: Coordinate(v) for v in SHARED_COORDINATES}
+_RELATIVE_COORDINATES = {v: Coordinate(v, relative=True) for v in SHARED_COORDINATES}
+
+# Bare "~", the most common coordinate in relative scripts; shared instance
+RELATIVE_ZERO = _RELATIVE_COORDINATES[0]
+
+
+def make_coordinate(value: int, relative: bool = False) -> Coordinate:
+    """Return a Coordinate, shared if its value is common.
+
+    Args:
+        value: Coordinate value, or offset if relative
+        relative: Whether the coordinate is relative ("~")
+
+    Returns:
+        Coordinate equal to Coordinate(value, relative)
+    """
+    pool = _RELATIVE_COORDINATES if relative else _ABSOLUTE_COORDINATES
+    coord = pool.get(value)
+    return coord if coord is not None else Coordinate(value, relative)
+
+
+@dataclass(frozen=True, slots=True)
 class Position:
     """3D position."""
     x: Coordinate
@@ -36,22 +75,27 @@ class Position:
 
     def resolve(self, origin: tuple[int, int, int]) -> tuple[int, int, int]:
         """Resolve to absolute coordinates."""
+        # Inlined Coordinate.resolve: this runs once per command executed
+        x, y, z = self.x, self.y, self.z
         return (
-            self.x.resolve(origin[0]),
-            self.y.resolve(origin[1]),
-            self.z.resolve(origin[2]),
+            origin[0] + x.value if x.relative else x.value,
+            origin[1] + y.value if y.relative else y.value,
+            origin[2] + z.value if z.relative else z.value,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BlockSpec:
     """Block specification.
 
     Phase 2: Added block states support.
+
+    States are a tuple of (key, value) pairs sorted by key, so specs are
+    hashable and equal states compare equal regardless of source order.
     """
     namespace: str  # "minecraft"
     block_id: str   # "stone"
-    states: dict[str, str | int | bool] | None = None  # {"facing": "north", "half": "top"}
+    states: BlockStates | None = None  # (("facing", "north"), ("half", "top"))
 
     @property
     def full_id(self) -> str:
@@ -59,7 +103,61 @@ class BlockSpec:
         return f"{self.namespace}:{self.block_id}"
 
 
-@dataclass
+# Block states with each value's type alongside it; see typed_states
+TypedBlockStates = tuple[tuple[str, type, StateValue], ...]
+
+# Distinct block specs kept by intern_block_spec
+BLOCK_SPEC_CACHE_SIZE = 4096
+
+
+def typed_states(states: BlockStates | None) -> TypedBlockStates | None:
+    """Return states as (key, type, value) triples for use as a cache key.
+
+    True == 1 and hash(True) == hash(1), so caches keyed on plain states or
+    on a BlockSpec would hand a [powered=1] result to [powered=true].
+
+    Args:
+        states: Key-sorted state pairs, or None
+
+    Returns:
+        Key-sorted (key, type, value) triples, or None
+    """
+    if not states:
+        return None
+    return tuple((key, type(value), value) for key, value in states)
+
+
+def intern_block_spec(
+    namespace: str, block_id: str, states: BlockStates | None = None
+) -> BlockSpec:
+    """Return a shared BlockSpec for the given id and states.
+
+    Scripts repeat a handful of blocks thousands of times; handing out one
+    instance per distinct spec saves the allocations and lets later caches
+    keyed on the spec compare by identity first.
+
+    Args:
+        namespace: Block namespace ("minecraft")
+        block_id: Block id ("stone")
+        states: Key-sorted state pairs, or None
+
+    Returns:
+        BlockSpec equal to BlockSpec(namespace, block_id, states)
+    """
+    return _intern_block_spec(namespace, block_id, typed_states(states))
+
+
+@lru_cache(maxsize=BLOCK_SPEC_CACHE_SIZE)
+def _intern_block_spec(
+    namespace: str, block_id: str, states: TypedBlockStates | None
+) -> BlockSpec:
+    """Build the BlockSpec for intern_block_spec, keyed on typed states."""
+    if states is None:
+        return BlockSpec(namespace, block_id)
+    return BlockSpec(namespace, block_id, tuple((key, value) for key, _, value in states))
+
+
+@dataclass(frozen=True, slots=True)
 class SetblockCommand:
     """Parsed /setblock command.
 
@@ -70,7 +168,7 @@ class SetblockCommand:
     mode: Literal["replace"] = "replace"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FillCommand:
     """Parsed /fill command.
 
@@ -79,7 +177,7 @@ class FillCommand:
     pos1: Position
     pos2: Position
     block: BlockSpec
-    mode: Literal["replace", "destroy", "hollow", "keep", "outline"] = "replace"
+    mode: FillMode = "replace"
 
 
 CommandAST = SetblockCommand | FillCommand
@@ -1,30 +1,184 @@
 """Command parser using Lark."""
 
+import functools
+import re
 from pathlib import Path
+from typing import cast
 
 from lark import Lark, LarkError
 
 from minecraft_holodeck.exceptions import CommandSyntaxError
-from minecraft_holodeck.parser.ast import CommandAST, FillCommand, SetblockCommand
-from minecraft_holodeck.parser.transformer import ASTTransformer
+from minecraft_holodeck.parser.ast import (
+    RELATIVE_ZERO,
+    SHARED_COORDINATES,
+    BlockSpec,
+    CommandAST,
+    Coordinate,
+    FillCommand,
+    FillMode,
+    Position,
+    SetblockCommand,
+    intern_block_spec,
+    make_coordinate,
+)
+from minecraft_holodeck.parser.transformer import (
+    ASTTransformer,
+    sorted_block_states,
+    state_value_from_text,
+)
+
+# Number of distinct command strings whose ASTs are kept per parser
+PARSE_CACHE_SIZE = 4096
+
+GRAMMAR_PATH = Path(__file__).parent / "grammar.lark"
+
+
+@functools.cache
+def _build_lark() -> Lark:
+    """Compile the command grammar once per process.
+
+    Lark parsers hold no per-parse state, so every CommandParser shares
+    this one. cache=True also stores the LALR tables in the temp dir,
+    keyed by the grammar's hash, so later processes load them instead of
+    rebuilding.
+
+    The AST transformer runs inside the LALR parser as each rule reduces,
+    so parse() returns AST nodes directly and no parse tree is built.
+    Pass-through rules are inlined in the grammar (?coord), so they cost
+    no callback, and optional items are left out rather than passed as None.
+
+    Returns:
+        LALR parser with 'start' and 'block_spec' entry points
+    """
+    return Lark(
+        GRAMMAR_PATH.read_text(),
+        parser='lalr',
+        start=['start', 'block_spec'],
+        transformer=ASTTransformer(),
+        maybe_placeholders=False,
+        cache=True,
+    )
+
+
+# Plain commands are parsed with a regex instead of Lark. Coordinates are
+# "N", "~" or "~N"; block ids follow the grammar's WORD, and block states
+# its STATE_KEY "=" (SIGNED_INT | WORD) pairs (BOOLEAN is WORD-shaped).
+# re.ASCII keeps \d and \s to the grammar's ASCII digits and whitespace.
+_COORD = r"(~|~?[+-]?\d+)"
+_STATE_PAIR = r"([a-z][a-z0-9_]*)\s*=\s*([+-]?\d+|[a-z][a-z0-9_/]*)"
+_BLOCK = (
+    r"(?:([a-z][a-z0-9_/]*):)?([a-z][a-z0-9_/]*)"
+    rf"(?:\s*\[\s*({_STATE_PAIR}\s*(?:,\s*{_STATE_PAIR}\s*)*)\])?"
+)
+_FAST_SETBLOCK_RE = re.compile(
+    rf"\s*setblock\s+{_COORD}\s+{_COORD}\s+{_COORD}\s+{_BLOCK}\s*", re.ASCII
+)
+_FAST_FILL_RE = re.compile(
+    r"\s*fill" + rf"\s+{_COORD}" * 6 + rf"\s+{_BLOCK}"
+    r"(?:\s+(destroy|hollow|keep|outline|replace))?\s*",
+    re.ASCII,
+)
+_STATE_PAIR_RE = re.compile(_STATE_PAIR, re.ASCII)
+
+# The grammar reads "~ 5" as the single coordinate "~5" (whitespace is
+# ignored between "~" and its offset); leave such lines to Lark so both
+# paths agree
+_SPACED_TILDE_RE = re.compile(r"~\s+[+-]?\d", re.ASCII)
+
+
+# Coordinate text of every shared value ("64", "~-1", "~"), so common
+# coordinates are one dict lookup instead of int() and two branches
+_COORDINATES_BY_TEXT = {
+    **{str(v): make_coordinate(v) for v in SHARED_COORDINATES},
+    **{f"~{v}": make_coordinate(v, relative=True) for v in SHARED_COORDINATES},
+    "~": RELATIVE_ZERO,
+}
+
+
+def _fast_coord(text: str) -> Coordinate:
+    """Build a Coordinate from a fast-path match group."""
+    coord = _COORDINATES_BY_TEXT.get(text)
+    if coord is not None:
+        return coord
+    if text[0] != "~":
+        return make_coordinate(int(text))
+    if len(text) == 1:
+        return RELATIVE_ZERO
+    return make_coordinate(int(text[1:]), relative=True)
+
+
+def _fast_parse(command: str) -> CommandAST | None:
+    """Parse a plain /setblock or /fill command without Lark.
+
+    Args:
+        command: Command string with any leading / removed
+
+    Returns:
+        The same AST Lark would produce, or None if the command has
+        anything the fast path does not cover
+    """
+    match = _FAST_SETBLOCK_RE.fullmatch(command) or _FAST_FILL_RE.fullmatch(command)
+    if match is None or _SPACED_TILDE_RE.search(command):
+        return None
+
+    groups = match.groups()
+    n = 3 if match.re is _FAST_SETBLOCK_RE else 6
+    # Group n + 2 holds the text between the brackets; the pair groups
+    # after it only keep their last repetition, so pairs are re-found
+    states = groups[n + 2]
+    block = intern_block_spec(
+        groups[n] or "minecraft",
+        groups[n + 1],
+        sorted_block_states(
+            (key, state_value_from_text(value))
+            for key, value in _STATE_PAIR_RE.findall(states)
+        ) if states else None,
+    )
+    # Spelled out per axis: unpacking a generator here cost more than the
+    # regex match itself
+    coord = _fast_coord
+    pos1 = Position(coord(groups[0]), coord(groups[1]), coord(groups[2]))
+    if n == 3:
+        return SetblockCommand(pos1, block)
+    pos2 = Position(coord(groups[3]), coord(groups[4]), coord(groups[5]))
+    return FillCommand(pos1, pos2, block, cast(FillMode, groups[-1] or "replace"))
+
+
+@functools.cache
+def default_parser() -> "CommandParser":
+    """Return the shared process-wide parser.
+
+    Callers without special cache needs share this instance, and so
+    share its parse cache as well as the compiled grammar.
+
+    Returns:
+        CommandParser with the default cache size
+    """
+    return CommandParser()
 
 
 class CommandParser:
     """Parse Minecraft commands into AST."""
 
-    def __init__(self) -> None:
-        """Initialize parser with grammar."""
-        grammar_path = Path(__file__).parent / "grammar.lark"
-        self.parser = Lark(
-            grammar_path.read_text(),
-            parser='lalr',
-            start='start'
+    def __init__(self, cache_size: int | None = PARSE_CACHE_SIZE) -> None:
+        """Initialize parser with grammar.
+
+        Args:
+            cache_size: Number of distinct commands whose ASTs are cached
+                (None for unbounded, 0 to disable caching)
+        """
+        self.parser = _build_lark()
+        self._parse_cached = functools.lru_cache(maxsize=cache_size)(
+            self._parse_uncached
         )
-        self.transformer = ASTTransformer()
 
     def parse(self, command: str) -> CommandAST:
         """Parse command string into AST.
 
+        Results are cached per command string, so repeated commands (as in
+        generated scripts and batch files) skip the tokenizer entirely. The
+        returned AST is frozen and may be shared between calls.
+
         Args:
             command: Command string (with or without leading /)
 
@@ -34,13 +188,38 @@ class CommandParser:
         Raises:
             CommandSyntaxError: Invalid syntax
         """
+        return self._parse_cached(command)
+
+    def _parse_uncached(self, command: str) -> CommandAST:
+        """Parse command string into AST without consulting the cache."""
+        # Strip leading / if present
+        cmd = command.lstrip('/')
+        fast = _fast_parse(cmd)
+        if fast is not None:
+            return fast
         try:
-            # Strip leading / if present
-            cmd = command.lstrip('/')
-            tree = self.parser.parse(cmd)
-            result = self.transformer.transform(tree)
-            # The transformer returns our AST types
+            result = self.parser.parse(cmd, start='start')
+            # The embedded transformer returns our AST types
             assert isinstance(result, (SetblockCommand, FillCommand))
             return result
         except LarkError as e:
             raise CommandSyntaxError(f"Invalid syntax: {e}") from e
+
+    def parse_block(self, block: str) -> BlockSpec:
+        """Parse a standalone block specification.
+
+        Args:
+            block: Block string (e.g., "minecraft:lantern[hanging=false]")
+
+        Returns:
+            BlockSpec object
+
+        Raises:
+            CommandSyntaxError: Invalid syntax
+        """
+        try:
+            result = self.parser.parse(block, start='block_spec')
+            assert isinstance(result, BlockSpec)
+            return result
+        except LarkError as e:
+            raise CommandSyntaxError(f"Invalid block: {e}") from e
@@ -1,17 +1,59 @@
 """Lark transformer to convert parse tree to AST."""
 
-from typing import Any, Literal, cast
+from collections.abc import Iterable
+from operator import itemgetter
+from typing import Any, cast
 
 from lark import Token, Transformer
 
 from minecraft_holodeck.parser.ast import (
+    RELATIVE_ZERO,
     BlockSpec,
+    BlockStates,
     Coordinate,
     FillCommand,
+    FillMode,
     Position,
     SetblockCommand,
+    StateValue,
+    intern_block_spec,
+    make_coordinate,
 )
 
+# State values that become bools
+_BOOLEANS = {"true": True, "false": False}
+
+
+def state_value_from_text(value: str) -> StateValue:
+    """Convert the text of a block state value to its Python value.
+
+    Args:
+        value: A BOOLEAN, SIGNED_INT or WORD token's text
+
+    Returns:
+        bool for true/false, int for integers, otherwise the text itself
+    """
+    flag = _BOOLEANS.get(value)
+    if flag is not None:
+        return flag
+    # Words start with a letter and integers with a digit or sign, so the
+    # first character decides without a failed int() raising ValueError
+    return value if value[0].isalpha() else int(value)
+
+
+def sorted_block_states(pairs: Iterable[tuple[str, StateValue]]) -> BlockStates:
+    """Build block states from (key, value) pairs in source order.
+
+    A repeated key keeps its last value, as in Minecraft.
+
+    Args:
+        pairs: State pairs as written
+
+    Returns:
+        (key, value) pairs sorted by key
+    """
+    return tuple(sorted(dict(pairs).items(), key=itemgetter(0)))
+
 
 class ASTTransformer(Transformer):  # type: ignore[type-arg]
     """Transform Lark parse tree to AST."""
@@ -22,8 +64,7 @@ class ASTTransformer(Transformer):  # type: ignore[type-arg]
         Grammar: abs_coord -> SIGNED_INT
         Items: [number_token]
         """
-        value = int(items[0])
-        return Coordinate(value, relative=False)
+        return make_coordinate(int(items[0]))
 
     def rel_coord(self, items: list[Token]) -> Coordinate:
         """Transform relative coordinate.
@@ -34,53 +75,34 @@ class ASTTransformer(Transformer):  # type: ignore[type-arg]
         """
         if len(items) == 0:
             # Just ~, means offset 0
-            return Coordinate(0, relative=True)
+            return RELATIVE_ZERO
         else:
             # ~N, means offset N
-            value = int(items[0])
-            return Coordinate(value, relative=True)
-
-    def coord(self, items: list[Coordinate]) -> Coordinate:
-        """Pass through coordinate (abs_coord or rel_coord already transformed).
-
-        Grammar: coord -> abs_coord | rel_coord
-        Items: [Coordinate] (already transformed by abs_coord or rel_coord)
-        """
-        return items[0]
+            return make_coordinate(int(items[0]), relative=True)
 
     def position(self, items: list[Coordinate]) -> Position:
         """Transform position (3 coordinates)."""
         return Position(x=items[0], y=items[1], z=items[2])
 
-    def state_value(self, items: list[Token]) -> str | int | bool:
+    def state_value(self, items: list[Token]) -> StateValue:
         """Transform block state value."""
         if not items:
             # Should not happen with correct grammar
             raise ValueError("Empty state value")
 
-        value = str(items[0])
-
-        # Convert to appropriate type
-        if value == "true":
-            return True
-        elif value == "false":
-            return False
-        elif value.lstrip("-+").isdigit():
-            return int(value)
-        else:
-            return value
+        return state_value_from_text(str(items[0]))
 
-    def state_pair(self, items: list[Any]) -> tuple[str, str | int | bool]:
+    def state_pair(self, items: list[Any]) -> tuple[str, StateValue]:
         """Transform state key=value pair."""
         key = str(items[0])
         value = items[1]
         return (key, value)
 
     def block_states(
-        self, items: list[tuple[str, str | int | bool]]
-    ) -> dict[str, str | int | bool]:
-        """Transform block states into a dictionary."""
-        return dict(items)
+        self, items: list[tuple[str, StateValue]]
+    ) -> BlockStates:
+        """Transform block states into (key, value) pairs sorted by key."""
+        return sorted_block_states(items)
 
     def block_spec(self, items: list[Any]) -> BlockSpec:
         """Transform block specification.
@@ -99,10 +121,10 @@ class ASTTransformer(Transformer):  # type: ignore[type-arg]
 
         # Check for block states (optional)
         states = None
-        if len(items) > 1 and isinstance(items[1], dict):
+        if len(items) > 1 and isinstance(items[1], tuple):
             states = items[1]
 
-        return BlockSpec(namespace, block_id, states)
+        return intern_block_spec(namespace, block_id, states)
 
     def setblock_cmd(self, items: list[Any]) -> SetblockCommand:
         """Transform setblock command."""
@@ -120,5 +142,4 @@ class ASTTransformer(Transformer):  # type: ignore[type-arg]
         block = items[2]
         # Mode is a Token if present, need to convert to string and cast to Literal
         mode_str = str(items[3]) if len(items) > 3 else "replace"
-        mode = cast(Literal["replace", "destroy", "hollow", "keep", "outline"], mode_str)
-        return FillCommand(pos1, pos2, block, mode)
+        return FillCommand(pos1, pos2, block, cast(FillMode, mode_str))
@@ -0,0 +1,166 @@
+"""Fold overlapping box writes into their final state before touching a world.
+
+Build scripts tend to clear an area, lay a foundation, then a floor, then
+walls, each overwriting part of the previous step. Playing those writes into
+a dense array first (last writer wins) and emitting only the final runs means
+the world sees every voxel at most once.
+"""
+
+from collections.abc import Hashable, Sequence
+from typing import TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+B = TypeVar("B", bound=Hashable)
+
+# A box write: (x1, y1, z1, x2, y2, z2, block, mode) with inclusive corners
+FillOp = tuple[int, int, int, int, int, int, B, str]
+
+# Modes whose result depends only on the op itself, not on the world
+FOLDABLE_MODES = frozenset({"replace", "destroy", "hollow", "outline"})
+
+# Beyond this many cells the dense array costs more than it saves
+DEFAULT_MAX_CELLS = 1 << 24
+
+_UNSET = -1
+
+
+def fold_writes(
+    ops: Sequence[FillOp[B]],
+    air: B,
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> list[FillOp[B]]:
+    """Fold a sequence of box writes into a minimal set of disjoint fills.
+
+    Runs of foldable ops (replace, destroy, hollow, outline) are played into
+    a dense array of palette indices covering their union, then emitted as
+    "replace" boxes: runs along X, merged along Z where consecutive rows
+    match. Voxels that no op writes are left out. "keep" reads the world, so
+    it cannot be folded; it is passed through unchanged and splits the ops
+    around it into separate runs.
+
+    Args:
+        ops: Box writes in execution order
+        air: Block used for the interior of hollow fills
+        max_cells: Largest union volume to fold; bigger runs pass through
+
+    Returns:
+        Box writes with the same final effect, in execution order
+    """
+    folded: list[FillOp[B]] = []
+    run: list[FillOp[B]] = []
+
+    for op in ops:
+        if op[7] in FOLDABLE_MODES:
+            run.append(op)
+            continue
+        folded.extend(_fold_run(run, air, max_cells))
+        run = []
+        folded.append(op)
+
+    folded.extend(_fold_run(run, air, max_cells))
+    return folded
+
+
+def _fold_run(
+    ops: list[FillOp[B]], air: B, max_cells: int
+) -> list[FillOp[B]]:
+    """Fold a run of ops that do not depend on existing blocks."""
+    if len(ops) < 2:
+        return list(ops)
+
+    boxes = [
+        (
+            min(x1, x2), min(y1, y2), min(z1, z2),
+            max(x1, x2), max(y1, y2), max(z1, z2),
+        )
+        for x1, y1, z1, x2, y2, z2, _, _ in ops
+    ]
+    ox = min(b[0] for b in boxes)
+    oy = min(b[1] for b in boxes)
+    oz = min(b[2] for b in boxes)
+    shape = (
+        max(b[3] for b in boxes) - ox + 1,
+        max(b[4] for b in boxes) - oy + 1,
+        max(b[5] for b in boxes) - oz + 1,
+    )
+    if shape[0] * shape[1] * shape[2] > max_cells:
+        return list(ops)
+
+    palette: dict[B, int] = {}
+    blocks: list[B] = []
+
+    def index_of(block: B) -> int:
+        if block not in palette:
+            palette[block] = len(blocks)
+            blocks.append(block)
+        return palette[block]
+
+    grid = np.full(shape, _UNSET, dtype=np.int32)
+
+    for (x0, y0, z0, x1, y1, z1), op in zip(boxes, ops):
+        block, mode = op[6], op[7]
+        outer = np.s_[x0 - ox:x1 - ox + 1, y0 - oy:y1 - oy + 1, z0 - oz:z1 - oz + 1]
+        inner = np.s_[
+            x0 - ox + 1:x1 - ox, y0 - oy + 1:y1 - oy, z0 - oz + 1:z1 - oz
+        ]
+
+        if mode == "outline":
+            # Only the 12 edges, as WorldModifier writes outline
+            index = index_of(block)
+            xs, ys, zs = (x0 - ox, x1 - ox), (y0 - oy, y1 - oy), (z0 - oz, z1 - oz)
+            for y in ys:
+                for z in zs:
+                    grid[xs[0]:xs[1] + 1, y, z] = index
+            for x in xs:
+                for z in zs:
+                    grid[x, ys[0]:ys[1] + 1, z] = index
+                for y in ys:
+                    grid[x, y, zs[0]:zs[1] + 1] = index
+        else:
+            grid[outer] = index_of(block)
+            if mode == "hollow":
+                grid[inner] = index_of(air)
+
+    return [
+        (ox + x0, oy + y, oz + z0, ox + x1, oy + y, oz + z1, blocks[value], "replace")
+        for x0, x1, y, z0, z1, value in _emit_boxes(grid)
+    ]
+
+
+def _emit_boxes(
+    grid: npt.NDArray[np.int32],
+) -> list[tuple[int, int, int, int, int, int]]:
+    """Cover the set cells of a grid with boxes one voxel tall.
+
+    Returns:
+        (x0, x1, y, z0, z1, value) tuples in grid coordinates
+    """
+    size_x, size_y, size_z = grid.shape
+    boxes: list[tuple[int, int, int, int, int, int]] = []
+
+    for y in range(size_y):
+        # Runs open on the previous row, keyed by (x0, x1, value) -> start z
+        open_runs: dict[tuple[int, int, int], int] = {}
+
+        for z in range(size_z + 1):
+            runs: set[tuple[int, int, int]] = set()
+            if z < size_z:
+                row = grid[:, y, z]
+                starts = np.flatnonzero(np.diff(row, prepend=_UNSET - 1))
+                ends = np.append(starts[1:], size_x) - 1
+                runs = {
+                    (int(s), int(e), int(row[s]))
+                    for s, e in zip(starts, ends)
+                    if row[s] != _UNSET
+                }
+
+            for key in list(open_runs):
+                if key not in runs:
+                    x0, x1, value = key
+                    boxes.append((x0, x1, y, open_runs.pop(key), z - 1, value))
+            for key in runs:
+                open_runs.setdefault(key, z)
+
+    return boxes
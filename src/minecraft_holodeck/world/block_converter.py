@@ -1,8 +1,14 @@
 """Convert BlockSpec to Amulet Block objects."""
 
+import functools
+
 from amulet.api.block import Block  # type: ignore[import-untyped]
+from amulet_nbt import StringTag
+
+from minecraft_holodeck.parser.ast import BlockSpec, TypedBlockStates, typed_states
 
-from minecraft_holodeck.parser.ast import BlockSpec
+# Distinct (block, states) combinations kept; build scripts use a handful
+BLOCK_CACHE_SIZE = 512
 
 
 def blockspec_to_amulet(spec: BlockSpec) -> Block:
@@ -10,25 +16,38 @@ def blockspec_to_amulet(spec: BlockSpec) -> Block:
 
     Phase 2: Supports block states.
 
+    Conversions are memoized, so a script that places the same block many
+    times gets the same Block object back each time.
+
     Args:
         spec: Parsed block specification
 
     Returns:
         Amulet Block object ready for world placement
     """
+    return _blockspec_to_amulet(spec, typed_states(spec.states))
+
+
+@functools.lru_cache(maxsize=BLOCK_CACHE_SIZE)
+def _blockspec_to_amulet(spec: BlockSpec, typed: TypedBlockStates | None) -> Block:
+    """Convert a BlockSpec; typed carries its state value types.
+
+    BlockSpec equality treats True as 1, so the cache also keys on the typed
+    states to keep [powered=true] and [powered=1] apart.
+    """
     # If there are no block states, create simple block
     if not spec.states:
         return Block(spec.namespace, spec.block_id)
 
     # Convert block states to Amulet properties format
-    # Amulet expects all property values as strings
+    # Amulet stores property values as NBT string tags
     properties = {}
-    for key, value in spec.states.items():
+    for key, value in spec.states:
         # Convert booleans and integers to lowercase strings
         if isinstance(value, bool):
-            properties[key] = str(value).lower()
+            properties[key] = StringTag(str(value).lower())
         else:
-            properties[key] = str(value)
+            properties[key] = StringTag(str(value))
 
     # Create block with properties
     return Block(spec.namespace, spec.block_id, properties)
@@ -14,6 +14,7 @@ from amulet_nbt import TAG_Byte, TAG_Int, TAG_Long, TAG_String  # type: ignore[i
 
 from minecraft_holodeck.constants import MINECRAFT_PLATFORM, MINECRAFT_VERSION
 from minecraft_holodeck.exceptions import WorldOperationError
+from minecraft_holodeck.world.modifier import Region, WorldModifier
 
 
 @contextmanager
@@ -57,22 +58,20 @@ def _create_base_world(
     )
 
     try:
-        # Set world name in level.dat
-        world_wrapper.root_tag["Data"]["LevelName"] = TAG_String(name)
-
-        # Set game rules and world settings
-        world_wrapper.root_tag["Data"]["GameType"] = TAG_Int(1)  # Creative mode
-        world_wrapper.root_tag["Data"]["Difficulty"] = TAG_Byte(2)  # Normal difficulty
-        world_wrapper.root_tag["Data"]["hardcore"] = TAG_Byte(0)
-        world_wrapper.root_tag["Data"]["MapFeatures"] = TAG_Byte(0)  # No structures
-        world_wrapper.root_tag["Data"]["raining"] = TAG_Byte(0)
-        world_wrapper.root_tag["Data"]["thundering"] = TAG_Byte(0)
-        world_wrapper.root_tag["Data"]["Time"] = TAG_Long(6000)  # Noon
-
-        # Set spawn point
-        world_wrapper.root_tag["Data"]["SpawnX"] = TAG_Int(spawn_x)
-        world_wrapper.root_tag["Data"]["SpawnY"] = TAG_Int(spawn_y)
-        world_wrapper.root_tag["Data"]["SpawnZ"] = TAG_Int(spawn_z)
+        # Set world name, game rules and spawn point in level.dat in one update
+        world_wrapper.root_tag["Data"].update({
+            "LevelName": TAG_String(name),
+            "GameType": TAG_Int(1),  # Creative mode
+            "Difficulty": TAG_Byte(2),  # Normal difficulty
+            "hardcore": TAG_Byte(0),
+            "MapFeatures": TAG_Byte(0),  # No structures
+            "raining": TAG_Byte(0),
+            "thundering": TAG_Byte(0),
+            "Time": TAG_Long(6000),  # Noon
+            "SpawnX": TAG_Int(spawn_x),
+            "SpawnY": TAG_Int(spawn_y),
+            "SpawnZ": TAG_Int(spawn_z),
+        })
 
         yield world_wrapper
     finally:
@@ -142,7 +141,6 @@ def create_flat_world(
             pass  # World is saved and closed by context manager
 
         # Now use WorldModifier to fill the world with layers
-        from minecraft_holodeck.world.modifier import WorldModifier
         with WorldModifier(str(world_path)) as world:
             # Calculate bounds
             min_x = 0
@@ -150,27 +148,23 @@ def create_flat_world(
             max_x = size_chunks[0] * 16 - 1
             max_z = size_chunks[1] * 16 - 1
 
-            # Fill each layer
+            # Build every layer, then write them in one pass so each chunk
+            # is loaded and touched once rather than once per layer
+            regions: list[Region] = []
             current_y = 0
             for block_id, thickness in layers:
                 # Add minecraft namespace if not present
-                if ":" not in block_id:
-                    block_id = f"minecraft:{block_id}"
-
-                namespace, base_name = block_id.split(":")
+                namespace, sep, base_name = block_id.partition(":")
+                if not sep:
+                    namespace, base_name = "minecraft", block_id
                 block = Block(namespace, base_name)
 
-                # Fill this layer
                 layer_top = current_y + thickness - 1
-                world.fill_region(
-                    min_x, current_y, min_z,
-                    max_x, layer_top, max_z,
-                    block,
-                    mode="replace"
-                )
+                regions.append((min_x, current_y, min_z, max_x, layer_top, max_z, block))
 
                 current_y += thickness
 
+            world.fill_regions(regions)
             world.save()
 
     except Exception as e:
@@ -223,18 +217,15 @@ def create_void_world(
 
         # Add spawn platform if requested using WorldModifier
         if spawn_platform:
-            from minecraft_holodeck.world.modifier import WorldModifier
             with WorldModifier(str(world_path)) as world:
                 platform = Block("minecraft", "stone")
-                # 3x3 platform at spawn point
-                for dx in range(-1, 2):
-                    for dz in range(-1, 2):
-                        world.set_block(
-                            spawn_x + dx,
-                            spawn_y - 1,  # One block below spawn
-                            spawn_z + dz,
-                            platform
-                        )
+                # 3x3 platform at spawn point, one block below spawn
+                world.fill_region(
+                    spawn_x - 1, spawn_y - 1, spawn_z - 1,
+                    spawn_x + 1, spawn_y - 1, spawn_z + 1,
+                    platform,
+                    mode="replace"
+                )
                 world.save()
 
     except Exception as e:
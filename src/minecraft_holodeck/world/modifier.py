@@ -1,14 +1,62 @@
 """World modification interface using amulet-core."""
 
-from typing import Any
+import os
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, ClassVar
 
 import amulet  # type: ignore[import-untyped]
+import numpy as np
 from amulet.api.block import Block  # type: ignore[import-untyped]
+from amulet.api.block_entity import BlockEntity  # type: ignore[import-untyped]
+from amulet.api.chunk import Chunk  # type: ignore[import-untyped]
+from amulet.api.errors import ChunkDoesNotExist  # type: ignore[import-untyped]
 from amulet.api.level import World  # type: ignore[import-untyped]
 
 from minecraft_holodeck.constants import MINECRAFT_PLATFORM, MINECRAFT_VERSION
 from minecraft_holodeck.exceptions import WorldOperationError
 
+# A box write: (x1, y1, z1, x2, y2, z2, block) with inclusive corners
+Region = tuple[int, int, int, int, int, int, Block]
+
+# Inclusive box corners: (min_x, min_y, min_z, max_x, max_y, max_z)
+Box = tuple[int, int, int, int, int, int]
+
+# Box writes grouped by chunk (cx, cz), each box clipped to its chunk
+ChunkPlan = dict[tuple[int, int], list[tuple[Box, Block]]]
+
+# Blocks that count as empty; built once so fills reuse their cached
+# translations instead of constructing new Block objects per call
+_AIR = Block("minecraft", "air")
+_AIR_BLOCKS = (_AIR, Block("minecraft", "cave_air"), Block("minecraft", "void_air"))
+
+# Fill modes that, on a single block, just place it (keep depends on the world)
+_SINGLE_BLOCK_MODES = frozenset({"replace", "destroy", "hollow", "outline"})
+
+
+def _drop_page_cache(region_dir: Path) -> None:
+    """Advise the OS that cached pages of region files are no longer needed.
+
+    Best effort: a no-op on platforms without posix_fadvise (Windows, macOS)
+    and for files that cannot be opened.
+
+    Args:
+        region_dir: Directory containing .mca region files
+    """
+    if not hasattr(os, "posix_fadvise") or not region_dir.is_dir():
+        return
+    for region_file in region_dir.glob("*.mca"):
+        try:
+            fd = os.open(region_file, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
 
 class WorldModifier:
     """Interface to modify Minecraft worlds.
@@ -22,13 +70,18 @@ class WorldModifier:
         Args:
             world_path: Path to world folder (containing level.dat)
         """
+        self.world_path = Path(world_path)
         try:
             self.world: World = amulet.load_level(world_path)
             self.dimension = "minecraft:overworld"  # Default dimension
             self.platform = MINECRAFT_PLATFORM
             self.version = MINECRAFT_VERSION
+            # Built once; set_version_block takes the pair on every call
+            self._platform_version = (self.platform, self.version)
         except Exception as e:
             raise WorldOperationError(f"Failed to load world: {e}") from e
+        # Translated palette entries, so each distinct block is resolved once
+        self._universal: dict[Block, tuple[int, BlockEntity | None]] = {}
 
     def set_block(
         self,
@@ -49,7 +102,7 @@ class WorldModifier:
             self.world.set_version_block(
                 x, y, z,
                 self.dimension,
-                (self.platform, self.version),
+                self._platform_version,
                 block
             )
         except Exception as e:
@@ -57,19 +110,223 @@ class WorldModifier:
                 f"Failed to set block at ({x}, {y}, {z}): {e}"
             ) from e
 
-    def _place_block(self, x: int, y: int, z: int, block: Block) -> None:
-        """Internal helper to place a block at the given coordinates.
+    def set_blocks(
+        self,
+        positions: Sequence[tuple[int, int, int]],
+        block: Block,
+    ) -> int:
+        """Set the same block at many positions, visiting each chunk once.
+
+        Positions are grouped by chunk and sub-chunk and written with a
+        single NumPy scatter per sub-chunk.
 
         Args:
-            x, y, z: Absolute coordinates
-            block: Amulet Block object to place
+            positions: Absolute (x, y, z) coordinates
+            block: Amulet Block object
+
+        Returns:
+            Number of blocks modified
+        """
+        if not positions:
+            return 0
+
+        try:
+            index, block_entity = self._to_universal(block)
+            coords = np.asarray(positions, dtype=np.int64).reshape(-1, 3)
+            chunk_keys = coords[:, [0, 2]] >> 4
+            keys, groups = np.unique(chunk_keys, axis=0, return_inverse=True)
+
+            for group, (cx, cz) in enumerate(keys.tolist()):
+                chunk = self._get_or_create_chunk(cx, cz)
+                xs, ys, zs = coords[groups.ravel() == group].T
+                for cy in np.unique(ys >> 4).tolist():
+                    in_section = (ys >> 4) == cy
+                    chunk.blocks.get_sub_chunk(cy)[
+                        xs[in_section] & 15, ys[in_section] & 15, zs[in_section] & 15
+                    ] = index
+
+                block_entities = chunk.block_entities
+                for x, y, z in zip(xs.tolist(), ys.tolist(), zs.tolist()):
+                    if block_entity is not None:
+                        block_entities[(x, y, z)] = block_entity
+                    elif (x, y, z) in block_entities:
+                        del block_entities[(x, y, z)]
+                chunk.changed = True
+
+            return len(coords)
+        except Exception as e:
+            raise WorldOperationError(f"Failed to set blocks: {e}") from e
+
+    def _to_universal(self, block: Block) -> tuple[int, BlockEntity | None]:
+        """Translate a block to the universal format once.
+
+        Mirrors what amulet's ``set_version_block`` does per call, so the
+        result can be reused for every cell a command touches. Results are
+        cached for the lifetime of the modifier (the level palette only
+        grows, so indices stay valid).
+
+        Args:
+            block: Amulet Block object in our platform/version format
+
+        Returns:
+            Tuple of (index into the level block palette, block entity or None)
+        """
+        cached = self._universal.get(block)
+        if cached is not None:
+            return cached
+
+        translator = self.world.translation_manager.get_version(
+            self.platform, self.version
+        ).block
+        src_blocks = block.block_tuple
+        universal_block, block_entity, _ = translator.to_universal(src_blocks[0])
+        for src_block in src_blocks[1:]:
+            universal_block += translator.to_universal(src_block)[0]
+        index = self.world.block_palette.get_add_block(universal_block)
+        if not isinstance(block_entity, BlockEntity):
+            block_entity = None
+        self._universal[block] = (index, block_entity)
+        return index, block_entity
+
+    def _get_or_create_chunk(self, cx: int, cz: int) -> Chunk:
+        """Load a chunk, creating an empty one if it does not exist yet."""
+        try:
+            return self.world.get_chunk(cx, cz, self.dimension)
+        except ChunkDoesNotExist:
+            return self.world.create_chunk(cx, cz, self.dimension)
+
+    def _write_box(
+        self,
+        chunk: Chunk,
+        min_x: int, min_y: int, min_z: int,
+        max_x: int, max_y: int, max_z: int,
+        index: int,
+        block_entity: BlockEntity | None,
+    ) -> None:
+        """Write one palette index into a box that lies inside ``chunk``.
+
+        Args:
+            chunk: Chunk containing the whole box
+            min_x, min_y, min_z: Minimum corner (absolute coordinates)
+            max_x, max_y, max_z: Maximum corner (absolute coordinates)
+            index: Index into the level block palette
+            block_entity: Block entity to place in every cell, or None
+        """
+        ox, oz = chunk.cx * 16, chunk.cz * 16
+        chunk.blocks[
+            min_x - ox:max_x - ox + 1,
+            min_y:max_y + 1,
+            min_z - oz:max_z - oz + 1,
+        ] = index
+
+        # Drop block entities that were overwritten, like set_version_block does
+        block_entities = chunk.block_entities
+        for x, y, z in list(block_entities.keys()):
+            if min_x <= x <= max_x and min_y <= y <= max_y and min_z <= z <= max_z:
+                del block_entities[(x, y, z)]
+        if block_entity is not None:
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    for z in range(min_z, max_z + 1):
+                        block_entities[(x, y, z)] = block_entity
+
+        chunk.changed = True
+
+    @staticmethod
+    def _chunk_clips(
+        min_x: int, min_y: int, min_z: int,
+        max_x: int, max_y: int, max_z: int,
+    ) -> Iterator[tuple[int, int, Box]]:
+        """Split a normalized box into the parts that fall in each chunk.
+
+        Yields:
+            (cx, cz, box) where box is the part of the region inside that chunk
+        """
+        for cx in range(min_x >> 4, (max_x >> 4) + 1):
+            for cz in range(min_z >> 4, (max_z >> 4) + 1):
+                yield cx, cz, (
+                    max(min_x, cx * 16), min_y, max(min_z, cz * 16),
+                    min(max_x, cx * 16 + 15), max_y, min(max_z, cz * 16 + 15),
+                )
+
+    @classmethod
+    def plan_regions(cls, regions: list[Region]) -> tuple[ChunkPlan, int]:
+        """Split regions into per-chunk boxes without touching the world.
+
+        The plan depends only on coordinates, so it can be computed once and
+        applied to any number of worlds with :meth:`apply_plan`.
+
+        Args:
+            regions: List of (x1, y1, z1, x2, y2, z2, block) tuples
+
+        Returns:
+            Tuple of (boxes grouped by chunk in first-touch order, total volume)
+        """
+        plan: ChunkPlan = {}
+        count = 0
+
+        for x1, y1, z1, x2, y2, z2, block in regions:
+            min_x, max_x = min(x1, x2), max(x1, x2)
+            min_y, max_y = min(y1, y2), max(y1, y2)
+            min_z, max_z = min(z1, z2), max(z1, z2)
+            count += (max_x - min_x + 1) * (max_y - min_y + 1) * (max_z - min_z + 1)
+
+            for cx, cz, box in cls._chunk_clips(min_x, min_y, min_z, max_x, max_y, max_z):
+                plan.setdefault((cx, cz), []).append((box, block))
+
+        return plan, count
+
+    def _write_plan(self, plan: ChunkPlan) -> None:
+        """Write a plan from :meth:`plan_regions`, one chunk at a time."""
+        # Translate up front so an unknown block fails before any write
+        for boxes in plan.values():
+            for _, block in boxes:
+                self._to_universal(block)
+
+        for (cx, cz), boxes in plan.items():
+            chunk = self._get_or_create_chunk(cx, cz)
+            for box, block in boxes:
+                self._write_box(chunk, *box, *self._to_universal(block))
+
+    def _fill_boxes(self, regions: list[Region]) -> int:
+        """Write many regions chunk by chunk (see :meth:`fill_regions`).
+
+        Returns:
+            Total volume of the regions
+        """
+        plan, count = self.plan_regions(regions)
+        self._write_plan(plan)
+        return count
+
+    def apply_plan(self, plan: ChunkPlan) -> None:
+        """Write a precomputed plan from :meth:`plan_regions`.
+
+        Args:
+            plan: Boxes grouped by chunk
+        """
+        try:
+            self._write_plan(plan)
+        except Exception as e:
+            raise WorldOperationError(f"Failed to fill regions: {e}") from e
+
+    def fill_regions(self, regions: list[Region]) -> int:
+        """Replace the blocks in many regions, visiting each chunk once.
+
+        Regions are grouped by the chunks they overlap and applied chunk by
+        chunk. Within a chunk they are applied in the given order, so where
+        regions overlap the last one wins, exactly as if each region had been
+        filled in turn.
+
+        Args:
+            regions: List of (x1, y1, z1, x2, y2, z2, block) tuples
+
+        Returns:
+            Number of blocks modified
         """
-        self.world.set_version_block(
-            x, y, z,
-            self.dimension,
-            (self.platform, self.version),
-            block
-        )
+        try:
+            return self._fill_boxes(regions)
+        except Exception as e:
+            raise WorldOperationError(f"Failed to fill regions: {e}") from e
 
     def fill_region(
         self,
@@ -96,19 +353,20 @@ class WorldModifier:
         min_y, max_y = min(y1, y2), max(y1, y2)
         min_z, max_z = min(z1, z2), max(z1, z2)
 
-        # Dispatch to appropriate fill method based on mode
+        # A one-block fill is a setblock, which skips the box planning
+        if (
+            min_x == max_x and min_y == max_y and min_z == max_z
+            and mode in _SINGLE_BLOCK_MODES
+        ):
+            self.set_block(min_x, min_y, min_z, block)
+            return 1
+
+        # Dispatch to the fill method for this mode
+        fill = self._FILL_METHODS.get(mode)
+        if fill is None:
+            raise WorldOperationError(f"Unknown fill mode: {mode}")
         try:
-            if mode == "hollow":
-                return self._fill_hollow(min_x, min_y, min_z, max_x, max_y, max_z, block)
-            elif mode == "outline":
-                return self._fill_outline(min_x, min_y, min_z, max_x, max_y, max_z, block)
-            elif mode in ("replace", "destroy"):
-                # Replace and destroy are the same for now (both replace all blocks)
-                return self._fill_basic(min_x, min_y, min_z, max_x, max_y, max_z, block)
-            elif mode == "keep":
-                return self._fill_keep(min_x, min_y, min_z, max_x, max_y, max_z, block)
-            else:
-                raise WorldOperationError(f"Unknown fill mode: {mode}")
+            return fill(self, min_x, min_y, min_z, max_x, max_y, max_z, block)
         except WorldOperationError:
             raise
         except Exception as e:
@@ -132,13 +390,7 @@ class WorldModifier:
         Returns:
             Number of blocks modified
         """
-        count = 0
-        for x in range(min_x, max_x + 1):
-            for y in range(min_y, max_y + 1):
-                for z in range(min_z, max_z + 1):
-                    self._place_block(x, y, z, block)
-                    count += 1
-        return count
+        return self._fill_boxes([(min_x, min_y, min_z, max_x, max_y, max_z, block)])
 
     def _fill_hollow(
         self,
@@ -156,28 +408,20 @@ class WorldModifier:
         Returns:
             Number of blocks modified (not including air)
         """
-        count = 0
-        air = Block("minecraft", "air")
-
-        for x in range(min_x, max_x + 1):
-            for y in range(min_y, max_y + 1):
-                for z in range(min_z, max_z + 1):
-                    # Check if on boundary
-                    is_boundary = (
-                        x == min_x or x == max_x or
-                        y == min_y or y == max_y or
-                        z == min_z or z == max_z
-                    )
-
-                    if is_boundary:
-                        # Place block on boundary
-                        self._place_block(x, y, z, block)
-                        count += 1
-                    else:
-                        # Fill interior with air
-                        self._place_block(x, y, z, air)
+        volume = (max_x - min_x + 1) * (max_y - min_y + 1) * (max_z - min_z + 1)
+        regions: list[Region] = [(min_x, min_y, min_z, max_x, max_y, max_z, block)]
 
-        return count
+        # Carve the interior back out with air (only exists if every side > 2)
+        if max_x - min_x > 1 and max_y - min_y > 1 and max_z - min_z > 1:
+            regions.append((
+                min_x + 1, min_y + 1, min_z + 1,
+                max_x - 1, max_y - 1, max_z - 1,
+                _AIR,
+            ))
+            volume -= (max_x - min_x - 1) * (max_y - min_y - 1) * (max_z - min_z - 1)
+
+        self._fill_boxes(regions)
+        return volume
 
     def _fill_keep(
         self,
@@ -195,15 +439,42 @@ class WorldModifier:
         Returns:
             Number of blocks modified
         """
+        index, block_entity = self._to_universal(block)
+        air_indices = [self._to_universal(air)[0] for air in _AIR_BLOCKS]
+
         count = 0
-        for x in range(min_x, max_x + 1):
-            for y in range(min_y, max_y + 1):
-                for z in range(min_z, max_z + 1):
-                    # Check if current block is air
-                    existing = self.world.get_block(x, y, z, self.dimension)
-                    if existing.namespaced_name == "minecraft:air":
-                        self._place_block(x, y, z, block)
-                        count += 1
+        for cx, cz, (x0, y0, z0, x1, y1, z1) in self._chunk_clips(
+            min_x, min_y, min_z, max_x, max_y, max_z
+        ):
+            chunk = self._get_or_create_chunk(cx, cz)
+            ox, oz = cx * 16, cz * 16
+            placed = 0
+
+            # Work on each sub-chunk array in place: no copy of the region,
+            # and sub-chunks that do not exist yet are known to be all air
+            for cy in range(y0 >> 4, (y1 >> 4) + 1):
+                sy0, sy1 = max(y0, cy * 16), min(y1, cy * 16 + 15)
+                had_section = chunk.blocks.has_sub_chunk(cy)
+                view = chunk.blocks.get_sub_chunk(cy)[
+                    x0 - ox:x1 - ox + 1, sy0 & 15:(sy1 & 15) + 1, z0 - oz:z1 - oz + 1
+                ]
+                if had_section:
+                    is_air = np.isin(view, air_indices)
+                    view[is_air] = index
+                else:
+                    is_air = np.ones(view.shape, dtype=bool)
+                    view[...] = index
+                placed += int(np.count_nonzero(is_air))
+
+                if block_entity is not None:
+                    for dx, dy, dz in zip(*np.nonzero(is_air)):
+                        chunk.block_entities[
+                            (x0 + int(dx), sy0 + int(dy), z0 + int(dz))
+                        ] = block_entity
+
+            if placed:
+                chunk.changed = True
+                count += placed
         return count
 
     def _fill_outline(
@@ -214,6 +485,9 @@ class WorldModifier:
     ) -> int:
         """Outline fill: fill only the edges (12 lines of the box).
 
+        The edges are written as disjoint axis-aligned runs through the
+        chunk-level box writer, so each chunk gets one slice store per run.
+
         Args:
             min_x, min_y, min_z: Minimum corner
             max_x, max_y, max_z: Maximum corner
@@ -222,42 +496,63 @@ class WorldModifier:
         Returns:
             Number of blocks modified
         """
-        count = 0
+        # Distinct sides per axis; a flat box has one side, not two
+        xs = sorted({min_x, max_x})
+        ys = sorted({min_y, max_y})
+        zs = sorted({min_z, max_z})
 
-        # Fill the 12 edges of the box
-        # 4 edges parallel to X-axis
-        for x in range(min_x, max_x + 1):
-            for y, z in [(min_y, min_z), (min_y, max_z), (max_y, min_z), (max_y, max_z)]:
-                self._place_block(x, y, z, block)
-                count += 1
+        # 4 edges parallel to X-axis, corners included
+        regions: list[Region] = [
+            (min_x, y, z, max_x, y, z, block) for y in ys for z in zs
+        ]
 
         # 4 edges parallel to Y-axis (excluding already placed corners)
-        for y in range(min_y + 1, max_y):
-            for x, z in [(min_x, min_z), (min_x, max_z), (max_x, min_z), (max_x, max_z)]:
-                self._place_block(x, y, z, block)
-                count += 1
+        if max_y - min_y > 1:
+            regions += [(x, min_y + 1, z, x, max_y - 1, z, block) for x in xs for z in zs]
 
         # 4 edges parallel to Z-axis (excluding already placed corners)
-        for z in range(min_z + 1, max_z):
-            for x, y in [(min_x, min_y), (min_x, max_y), (max_x, min_y), (max_x, max_y)]:
-                self._place_block(x, y, z, block)
-                count += 1
+        if max_z - min_z > 1:
+            regions += [(x, y, min_z + 1, x, y, max_z - 1, block) for x in xs for y in ys]
 
-        return count
+        return self._fill_boxes(regions)
+
+    # Fill method per mode; replace and destroy are the same for now
+    # (both replace all blocks)
+    _FILL_METHODS: ClassVar[dict[str, Callable[..., int]]] = {
+        "replace": _fill_basic,
+        "destroy": _fill_basic,
+        "hollow": _fill_hollow,
+        "keep": _fill_keep,
+        "outline": _fill_outline,
+    }
 
     def save(self) -> None:
-        """Save all changes to world files."""
+        """Save all changes to world files.
+
+        Saving is idempotent: if nothing has changed since the last save the
+        world files are not touched again. amulet only serializes chunks
+        flagged as changed, which every write path here sets, so the I/O is
+        proportional to the chunks written rather than to loaded chunks.
+        """
+        if not self.world.changed:
+            return
         try:
             self.world.save()
         except Exception as e:
             raise WorldOperationError(f"Failed to save world: {e}") from e
 
     def close(self) -> None:
-        """Close the world."""
+        """Close the world.
+
+        Region files are then dropped from the OS page cache (where
+        supported): we are done with them, and scripts that create several
+        worlds in a row would otherwise evict more useful pages.
+        """
         try:
             self.world.close()
         except Exception as e:
             raise WorldOperationError(f"Failed to close world: {e}") from e
+        _drop_page_cache(self.world_path / "region")
 
     def __enter__(self) -> "WorldModifier":
         """Context manager entry."""
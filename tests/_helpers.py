@@ -0,0 +1,31 @@
+"""Commands and world readback shared by the API and compiler tests."""
+
+from pathlib import Path
+
+import amulet  # type: ignore[import-untyped]
+
+DIMENSION = "minecraft:overworld"
+
+COMMANDS = [
+    "/fill 0 64 0 20 64 20 minecraft:stone",
+    "/fill 2 64 2 18 64 18 minecraft:oak_planks",
+    "/setblock 10 64 10 minecraft:glass",
+    "/fill 4 65 4 8 68 8 minecraft:cobblestone hollow",
+    "/setblock 15 65 15 minecraft:glowstone",
+    "/fill 3 64 3 9 67 9 minecraft:glass outline",
+    "/fill 15 64 0 17 64 2 minecraft:air",
+]
+
+
+def block_names(world_path: Path) -> dict[tuple[int, int, int], str]:
+    """Read back the block name at every cell the commands touch."""
+    level = amulet.load_level(str(world_path))
+    try:
+        return {
+            (x, y, z): level.get_block(x, y, z, DIMENSION).namespaced_name
+            for x in range(0, 21)
+            for y in range(64, 69)
+            for z in range(0, 21)
+        }
+    finally:
+        level.close()
@@ -0,0 +1,43 @@
+"""Tests for BlockSpec to amulet Block conversion."""
+
+from amulet_nbt import StringTag
+
+from minecraft_holodeck.parser import BlockSpec
+from minecraft_holodeck.world import blockspec_to_amulet
+
+
+class TestBlockspecToAmulet:
+    """Test block conversion."""
+
+    def test_simple_block(self) -> None:
+        """Test converting a block without states."""
+        block = blockspec_to_amulet(BlockSpec("minecraft", "stone"))
+
+        assert block.namespaced_name == "minecraft:stone"
+        assert block.properties == {}
+
+    def test_states_become_string_tags(self) -> None:
+        """Test that state values are stored as NBT string tags."""
+        block = blockspec_to_amulet(
+            BlockSpec("minecraft", "lantern", (("hanging", False), ("level", 3)))
+        )
+
+        assert block.properties == {
+            "hanging": StringTag("false"),
+            "level": StringTag("3"),
+        }
+
+    def test_conversion_is_memoized(self) -> None:
+        """Test that equal specs convert to the same Block object."""
+        first = blockspec_to_amulet(BlockSpec("minecraft", "oak_stairs", (("facing", "east"),)))
+        second = blockspec_to_amulet(BlockSpec("minecraft", "oak_stairs", (("facing", "east"),)))
+
+        assert second is first
+
+    def test_int_and_bool_states_cached_apart(self) -> None:
+        """Test that [powered=1] and [powered=true] convert separately."""
+        as_int = blockspec_to_amulet(BlockSpec("minecraft", "lever", (("powered", 1),)))
+        as_bool = blockspec_to_amulet(BlockSpec("minecraft", "lever", (("powered", True),)))
+
+        assert as_int.properties == {"powered": StringTag("1")}
+        assert as_bool.properties == {"powered": StringTag("true")}
@@ -1,113 +1,229 @@
 """Tests for command parser."""
 
+import dataclasses
+
 import pytest
 
 from minecraft_holodeck.parser import (
     BlockSpec,
+    CommandAST,
     CommandParser,
     CommandSyntaxError,
     Coordinate,
     FillCommand,
     Position,
     SetblockCommand,
+    default_parser,
 )
+from minecraft_holodeck.parser.ast import FillMode
+
+
+@pytest.fixture(scope="module")
+def parser() -> CommandParser:
+    """Share one parser across the parsing tests in this module."""
+    return CommandParser()
+
+
+def _at(x: int, y: int, z: int) -> Position:
+    """Build an absolute Position."""
+    return Position(Coordinate(x), Coordinate(y), Coordinate(z))
+
+
+def _rel(x: int, y: int, z: int) -> Position:
+    """Build a fully relative Position ("~x ~y ~z")."""
+    return Position(
+        Coordinate(x, relative=True), Coordinate(y, relative=True), Coordinate(z, relative=True)
+    )
 
 
 class TestBasicParsing:
     """Test basic command parsing."""
 
-    def test_parse_basic_setblock(self) -> None:
-        """Test parsing basic setblock command."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 10 64 10 minecraft:stone")
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            (
+                "/setblock 10 64 10 minecraft:stone",
+                SetblockCommand(_at(10, 64, 10), BlockSpec("minecraft", "stone")),
+            ),
+            (
+                "setblock 0 0 0 minecraft:dirt",
+                SetblockCommand(_at(0, 0, 0), BlockSpec("minecraft", "dirt")),
+            ),
+            (
+                "/setblock 5 5 5 stone",
+                SetblockCommand(_at(5, 5, 5), BlockSpec("minecraft", "stone")),
+            ),
+            (
+                "/setblock -10 64 -20 minecraft:glass",
+                SetblockCommand(_at(-10, 64, -20), BlockSpec("minecraft", "glass")),
+            ),
+            (
+                "/setblock 0 0 0 mymod:custom_block",
+                SetblockCommand(_at(0, 0, 0), BlockSpec("mymod", "custom_block")),
+            ),
+        ],
+    )
+    def test_parse_setblock(
+        self, parser: CommandParser, command: str, expected: SetblockCommand
+    ) -> None:
+        """Test setblock with and without slash, namespace and signs."""
+        assert parser.parse(command) == expected
+
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            (
+                "/fill 0 64 0 10 70 10 minecraft:stone",
+                FillCommand(_at(0, 64, 0), _at(10, 70, 10), BlockSpec("minecraft", "stone")),
+            ),
+            (
+                "/fill -5 0 -5 5 10 5 minecraft:air",
+                FillCommand(_at(-5, 0, -5), _at(5, 10, 5), BlockSpec("minecraft", "air")),
+            ),
+        ],
+    )
+    def test_parse_fill(
+        self, parser: CommandParser, command: str, expected: FillCommand
+    ) -> None:
+        """Test parsing fill with positive and negative coordinates."""
+        assert parser.parse(command) == expected
+
+
+class TestFastPath:
+    """Test that the regex fast path agrees with the Lark grammar."""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "/setblock 0 64 0 stone",
+            "setblock -1 +2 3 minecraft:oak_planks",
+            "/setblock ~ ~-1 ~+2 custom:pipe/bend",
+            "/fill 0 64 0 ~10 ~ ~-5 glass hollow",
+            "/fill 0\t64 0  9 64 7 dirt replace",
+            "  setblock 1 2 3 keep  ",
+            "/setblock ~ 5 6 ~ stone",
+            "/setblock 1 2 3 oak_stairs[facing=north,half=top,waterlogged=false]",
+            "/fill 0 0 0 1 1 1 lantern [ hanging = true , level=-3 ] keep",
+            "/setblock 1 2 3 a[x=1,x=truex,y=b/c]",
+            "/setblock 1 2 3 a[x=1]",
+        ],
+    )
+    def test_fast_path_matches_lark(self, command: str) -> None:
+        """Test that every command parses to the same AST either way."""
+        parser = CommandParser(cache_size=0)
+        expected = parser.parser.parse(command.strip().lstrip("/"), start="start")
+
+        assert parser.parse(command) == expected
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "/setblock 0 64 0 stone[]",
+            "/setblock 0 64 0 stone[x=5a]",
+            "/setblock 0 64 0 stone[x=1_000]",
+            "/setblock 0 64 0 stone[x=1,]",
+        ],
+    )
+    def test_fast_path_rejects_bad_states(self, command: str) -> None:
+        """Test that malformed states still raise a syntax error."""
+        with pytest.raises(CommandSyntaxError):
+            CommandParser(cache_size=0).parse(command)
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "/setblock １ 64 3 stone",
+            "/fill 0 64 0 5 ６４ 5 stone",
+            "/setblock 1 64 3 lever[powered=１]",
+        ],
+    )
+    def test_fast_path_rejects_non_ascii_digits(self, command: str) -> None:
+        """Test that digits the grammar's INT does not accept are rejected."""
+        with pytest.raises(CommandSyntaxError):
+            CommandParser(cache_size=0).parse(command)
 
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == 10
-        assert result.position.y.value == 64
-        assert result.position.z.value == 10
-        assert result.block.namespace == "minecraft"
-        assert result.block.block_id == "stone"
-        assert result.block.full_id == "minecraft:stone"
-
-    def test_parse_setblock_without_slash(self) -> None:
-        """Test parsing without leading slash."""
-        parser = CommandParser()
-        result = parser.parse("setblock 0 0 0 minecraft:dirt")
 
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == 0
-        assert result.block.block_id == "dirt"
+class TestParseCache:
+    """Test parse result caching."""
 
-    def test_parse_setblock_implicit_namespace(self) -> None:
-        """Test parsing with implicit minecraft: namespace."""
+    def test_repeated_command_returns_cached_ast(self) -> None:
+        """Test that parsing the same string twice reuses the AST."""
         parser = CommandParser()
-        result = parser.parse("/setblock 5 5 5 stone")
+        first = parser.parse("/setblock 1 64 1 minecraft:lantern")
+        second = parser.parse("/setblock 1 64 1 minecraft:lantern")
 
-        assert isinstance(result, SetblockCommand)
-        assert result.block.namespace == "minecraft"
-        assert result.block.block_id == "stone"
+        assert second is first
 
-    def test_parse_setblock_negative_coords(self) -> None:
-        """Test parsing with negative coordinates."""
+    def test_cached_ast_is_immutable(self) -> None:
+        """Test that a shared AST cannot be modified by a caller."""
         parser = CommandParser()
-        result = parser.parse("/setblock -10 64 -20 minecraft:glass")
+        result = parser.parse("/setblock 1 64 1 minecraft:lantern")
 
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == -10
-        assert result.position.z.value == -20
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.block = BlockSpec(namespace="minecraft", block_id="stone")  # type: ignore[misc]
+
+    def test_cache_can_be_disabled(self) -> None:
+        """Test that cache_size=0 parses afresh each time."""
+        parser = CommandParser(cache_size=0)
+        first = parser.parse("/setblock 1 64 1 minecraft:lantern")
+        second = parser.parse("/setblock 1 64 1 minecraft:lantern")
 
-    def test_parse_basic_fill(self) -> None:
-        """Test parsing basic fill command."""
+        assert second == first
+        assert second is not first
+
+    def test_syntax_errors_are_not_cached(self) -> None:
+        """Test that an invalid command raises every time."""
         parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:stone")
-
-        assert isinstance(result, FillCommand)
-        assert result.pos1.x.value == 0
-        assert result.pos1.y.value == 64
-        assert result.pos1.z.value == 0
-        assert result.pos2.x.value == 10
-        assert result.pos2.y.value == 70
-        assert result.pos2.z.value == 10
-        assert result.block.namespace == "minecraft"
-        assert result.block.block_id == "stone"
-
-    def test_parse_fill_negative_coords(self) -> None:
-        """Test parsing fill with negative coordinates."""
+        for _ in range(2):
+            with pytest.raises(CommandSyntaxError):
+                parser.parse("/setblock 0 0")
+
+    def test_block_specs_are_interned(self) -> None:
+        """Test that equal blocks in different commands share one BlockSpec."""
         parser = CommandParser()
-        result = parser.parse("/fill -5 0 -5 5 10 5 minecraft:air")
+        plain = parser.parse("/setblock 1 64 1 stone")
+        spaced = parser.parse("/setblock 1  64 2 minecraft:stone")
+        stairs = [
+            parser.parse(f"/setblock {x} 64 1 oak_stairs[half=top,facing=north]")
+            for x in range(2)
+        ]
 
-        assert isinstance(result, FillCommand)
-        assert result.pos1.x.value == -5
-        assert result.pos2.x.value == 5
+        assert plain.block is spaced.block
+        assert stairs[0].block is stairs[1].block
 
-    def test_parse_custom_namespace(self) -> None:
-        """Test parsing block with custom namespace."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 0 0 0 mymod:custom_block")
+    def test_common_coordinates_are_shared(self) -> None:
+        """Test that small coordinates are shared, on both parse paths."""
+        parser = CommandParser(cache_size=0)
+        fast = parser.parse("/setblock 5 64 ~-1 stone")
+        lark = parser.parser.parse("setblock 5 64 ~-1 stone", start="start")
+        assert isinstance(fast, SetblockCommand)
+        assert isinstance(lark, SetblockCommand)
 
-        assert isinstance(result, SetblockCommand)
-        assert result.block.namespace == "mymod"
-        assert result.block.block_id == "custom_block"
+        assert fast.position.x is lark.position.x
+        assert fast.position.y is lark.position.y
+        assert fast.position.z is lark.position.z
+
+    def test_default_parser_is_shared(self) -> None:
+        """Test that default_parser builds one parser per process."""
+        assert default_parser() is default_parser()
 
 
 class TestParseErrors:
     """Test error handling."""
 
-    def test_invalid_command(self) -> None:
+    def test_invalid_command(self, parser: CommandParser) -> None:
         """Test parsing invalid command."""
-        parser = CommandParser()
         with pytest.raises(CommandSyntaxError):
             parser.parse("/invalid 0 0 0")
 
-    def test_missing_arguments(self) -> None:
+    def test_missing_arguments(self, parser: CommandParser) -> None:
         """Test parsing with missing arguments."""
-        parser = CommandParser()
         with pytest.raises(CommandSyntaxError):
             parser.parse("/setblock 0 0")
 
-    def test_invalid_coordinate(self) -> None:
+    def test_invalid_coordinate(self, parser: CommandParser) -> None:
         """Test parsing with invalid coordinate."""
-        parser = CommandParser()
         with pytest.raises(CommandSyntaxError):
             parser.parse("/setblock abc 0 0 minecraft:stone")
 
@@ -115,25 +231,22 @@ class TestParseErrors:
 class TestCoordinateResolution:
     """Test coordinate resolution."""
 
-    def test_absolute_coordinate_resolve(self) -> None:
-        """Test resolving absolute coordinates."""
-        coord = Coordinate(10, relative=False)
-        assert coord.resolve(100) == 10  # Absolute ignores origin
-
-    def test_relative_coordinate_resolve(self) -> None:
-        """Test resolving relative coordinates."""
-        coord = Coordinate(5, relative=True)
-        assert coord.resolve(100) == 105  # 100 + 5
-
-    def test_relative_coordinate_negative_offset(self) -> None:
-        """Test resolving relative coordinates with negative offset."""
-        coord = Coordinate(-3, relative=True)
-        assert coord.resolve(100) == 97  # 100 + (-3)
-
-    def test_relative_coordinate_zero_offset(self) -> None:
-        """Test resolving relative coordinates with zero offset."""
-        coord = Coordinate(0, relative=True)
-        assert coord.resolve(100) == 100  # 100 + 0
+    @pytest.mark.parametrize(
+        ("value", "relative", "origin", "expected"),
+        [
+            (10, False, 100, 10),  # Absolute ignores origin
+            (-20, False, 100, -20),
+            (5, True, 100, 105),
+            (-3, True, 100, 97),
+            (0, True, 100, 100),
+            (0, True, -64, -64),
+        ],
+    )
+    def test_coordinate_resolve(
+        self, value: int, relative: bool, origin: int, expected: int
+    ) -> None:
+        """Test resolving absolute and relative coordinates."""
+        assert Coordinate(value, relative).resolve(origin) == expected
 
     def test_position_resolve(self) -> None:
         """Test resolving position."""
@@ -169,102 +282,59 @@ class TestCoordinateResolution:
 class TestRelativeCoordinates:
     """Test relative coordinate parsing (Phase 5)."""
 
-    def test_parse_setblock_relative_all(self) -> None:
-        """Test parsing setblock with all relative coordinates."""
-        parser = CommandParser()
-        result = parser.parse("/setblock ~5 ~-1 ~10 minecraft:stone")
-
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == 5
-        assert result.position.x.relative is True
-        assert result.position.y.value == -1
-        assert result.position.y.relative is True
-        assert result.position.z.value == 10
-        assert result.position.z.relative is True
-
-    def test_parse_setblock_relative_zero_offset(self) -> None:
-        """Test parsing setblock with ~ (zero offset)."""
-        parser = CommandParser()
-        result = parser.parse("/setblock ~ ~ ~ minecraft:stone")
-
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == 0
-        assert result.position.x.relative is True
-        assert result.position.y.value == 0
-        assert result.position.y.relative is True
-        assert result.position.z.value == 0
-        assert result.position.z.relative is True
-
-    def test_parse_setblock_mixed_coordinates(self) -> None:
-        """Test parsing setblock with mixed absolute and relative."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 10 ~5 -20 minecraft:glass")
-
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == 10
-        assert result.position.x.relative is False
-        assert result.position.y.value == 5
-        assert result.position.y.relative is True
-        assert result.position.z.value == -20
-        assert result.position.z.relative is False
-
-    def test_parse_fill_relative_coordinates(self) -> None:
-        """Test parsing fill with relative coordinates."""
-        parser = CommandParser()
-        result = parser.parse("/fill ~-5 ~ ~-5 ~5 ~10 ~5 minecraft:stone")
-
-        assert isinstance(result, FillCommand)
-        assert result.pos1.x.value == -5
-        assert result.pos1.x.relative is True
-        assert result.pos1.y.value == 0
-        assert result.pos1.y.relative is True
-        assert result.pos2.z.value == 5
-        assert result.pos2.z.relative is True
-
-    def test_parse_fill_mixed_coordinates(self) -> None:
-        """Test parsing fill with mixed absolute and relative."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 ~10 ~6 ~10 minecraft:glass")
-
-        assert isinstance(result, FillCommand)
-        assert result.pos1.x.value == 0
-        assert result.pos1.x.relative is False
-        assert result.pos2.x.value == 10
-        assert result.pos2.x.relative is True
-
-    def test_parse_relative_negative(self) -> None:
-        """Test parsing negative relative coordinates."""
-        parser = CommandParser()
-        result = parser.parse("/setblock ~-10 ~-5 ~-1 minecraft:dirt")
-
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == -10
-        assert result.position.x.relative is True
-        assert result.position.y.value == -5
-        assert result.position.y.relative is True
-        assert result.position.z.value == -1
-        assert result.position.z.relative is True
-
-    def test_parse_relative_with_block_states(self) -> None:
-        """Test parsing relative coordinates with block states."""
-        parser = CommandParser()
-        result = parser.parse("/setblock ~1 ~2 ~3 oak_stairs[facing=north,half=top]")
-
-        assert isinstance(result, SetblockCommand)
-        assert result.position.x.value == 1
-        assert result.position.x.relative is True
-        assert result.block.states is not None
-        assert result.block.states["facing"] == "north"
-
-    def test_parse_relative_with_fill_mode(self) -> None:
-        """Test parsing relative coordinates with fill mode."""
-        parser = CommandParser()
-        result = parser.parse("/fill ~ ~ ~ ~9 ~5 ~7 spruce_planks hollow")
-
-        assert isinstance(result, FillCommand)
-        assert result.pos1.x.relative is True
-        assert result.pos2.x.relative is True
-        assert result.mode == "hollow"
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            (
+                "/setblock ~5 ~-1 ~10 minecraft:stone",
+                SetblockCommand(_rel(5, -1, 10), BlockSpec("minecraft", "stone")),
+            ),
+            (
+                "/setblock ~ ~ ~ minecraft:stone",
+                SetblockCommand(_rel(0, 0, 0), BlockSpec("minecraft", "stone")),
+            ),
+            (
+                "/setblock 10 ~5 -20 minecraft:glass",
+                SetblockCommand(
+                    Position(Coordinate(10), Coordinate(5, relative=True), Coordinate(-20)),
+                    BlockSpec("minecraft", "glass"),
+                ),
+            ),
+            (
+                "/setblock ~-10 ~-5 ~-1 minecraft:dirt",
+                SetblockCommand(_rel(-10, -5, -1), BlockSpec("minecraft", "dirt")),
+            ),
+            (
+                "/fill ~-5 ~ ~-5 ~5 ~10 ~5 minecraft:stone",
+                FillCommand(_rel(-5, 0, -5), _rel(5, 10, 5), BlockSpec("minecraft", "stone")),
+            ),
+            (
+                "/fill 0 64 0 ~10 ~6 ~10 minecraft:glass",
+                FillCommand(_at(0, 64, 0), _rel(10, 6, 10), BlockSpec("minecraft", "glass")),
+            ),
+            (
+                "/setblock ~1 ~2 ~3 oak_stairs[facing=north,half=top]",
+                SetblockCommand(
+                    _rel(1, 2, 3),
+                    BlockSpec("minecraft", "oak_stairs", (("facing", "north"), ("half", "top"))),
+                ),
+            ),
+            (
+                "/fill ~ ~ ~ ~9 ~5 ~7 spruce_planks hollow",
+                FillCommand(
+                    _rel(0, 0, 0),
+                    _rel(9, 5, 7),
+                    BlockSpec("minecraft", "spruce_planks"),
+                    "hollow",
+                ),
+            ),
+        ],
+    )
+    def test_parse_relative(
+        self, parser: CommandParser, command: str, expected: CommandAST
+    ) -> None:
+        """Test relative, zero-offset, negative and mixed coordinates."""
+        assert parser.parse(command) == expected
 
 
 class TestBlockSpec:
@@ -281,153 +351,132 @@ class TestBlockSpec:
         assert spec.full_id == "mymod:custom_block"
 
 
-class TestBlockStates:
-    """Test block state parsing (Phase 2)."""
+class TestParseBlock:
+    """Test standalone block parsing."""
 
-    def test_parse_single_block_state(self) -> None:
-        """Test parsing block with single state."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 0 64 0 minecraft:oak_stairs[facing=north]")
+    def test_parse_block_with_states(self, parser: CommandParser) -> None:
+        """Test parsing a block string outside a command."""
+        result = parser.parse_block("lantern[hanging=false]")
 
-        assert isinstance(result, SetblockCommand)
-        assert result.block.block_id == "oak_stairs"
-        assert result.block.states is not None
-        assert result.block.states["facing"] == "north"
+        assert result == BlockSpec("minecraft", "lantern", (("hanging", False),))
 
-    def test_parse_multiple_block_states(self) -> None:
-        """Test parsing block with multiple states."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 0 64 0 minecraft:oak_stairs[facing=north,half=top]")
+    def test_parse_block_rejects_command(self, parser: CommandParser) -> None:
+        """Test that a full command is not a valid block."""
+        with pytest.raises(CommandSyntaxError):
+            parser.parse_block("setblock 0 0 0 stone")
 
-        assert isinstance(result, SetblockCommand)
-        assert result.block.states is not None
-        assert result.block.states["facing"] == "north"
-        assert result.block.states["half"] == "top"
 
-    def test_parse_block_state_with_boolean(self) -> None:
-        """Test parsing block state with boolean value."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 0 64 0 minecraft:oak_stairs[waterlogged=true]")
-
-        assert isinstance(result, SetblockCommand)
-        assert result.block.states is not None
-        assert result.block.states["waterlogged"] is True
+class TestBlockStates:
+    """Test block state parsing (Phase 2)."""
 
-    def test_parse_block_state_with_integer(self) -> None:
-        """Test parsing block state with integer value."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 0 64 0 minecraft:repeater[delay=3]")
+    @pytest.mark.parametrize(
+        ("block", "states"),
+        [
+            ("minecraft:oak_stairs[facing=north]", [("facing", str, "north")]),
+            (
+                "minecraft:oak_stairs[facing=north,half=top]",
+                [("facing", str, "north"), ("half", str, "top")],
+            ),
+            ("minecraft:oak_stairs[waterlogged=true]", [("waterlogged", bool, True)]),
+            ("minecraft:repeater[delay=3]", [("delay", int, 3)]),
+            (
+                "spruce_door[half=lower,hinge=left]",
+                [("half", str, "lower"), ("hinge", str, "left")],
+            ),
+            (
+                "minecraft:spruce_stairs[facing=east,half=top,shape=straight]",
+                [("facing", str, "east"), ("half", str, "top"), ("shape", str, "straight")],
+            ),
+        ],
+    )
+    def test_parse_block_states(
+        self, parser: CommandParser, block: str, states: list[tuple[str, type, object]]
+    ) -> None:
+        """Test string, boolean and integer state values.
+
+        States are compared with their types, since True == 1.
+        """
+        result = parser.parse(f"/setblock 0 64 0 {block}")
 
         assert isinstance(result, SetblockCommand)
         assert result.block.states is not None
-        assert result.block.states["delay"] == 3
+        assert [(k, type(v), v) for k, v in result.block.states] == states
 
-    def test_parse_door_with_states(self) -> None:
-        """Test parsing door with half and hinge states."""
-        parser = CommandParser()
-        result = parser.parse("/setblock 4 66 0 spruce_door[half=lower,hinge=left]")
-
-        assert isinstance(result, SetblockCommand)
-        assert result.block.namespace == "minecraft"
-        assert result.block.block_id == "spruce_door"
-        assert result.block.states is not None
-        assert result.block.states["half"] == "lower"
-        assert result.block.states["hinge"] == "left"
+    def test_parse_fill_with_block_states(self, parser: CommandParser) -> None:
+        """Test parsing fill command with block states."""
+        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:oak_stairs[facing=north]")
 
-    def test_parse_stairs_complex_states(self) -> None:
-        """Test parsing stairs with multiple states."""
-        parser = CommandParser()
-        result = parser.parse(
-            "/setblock 0 64 0 minecraft:spruce_stairs[facing=east,half=top,shape=straight]"
+        assert result == FillCommand(
+            _at(0, 64, 0),
+            _at(10, 70, 10),
+            BlockSpec("minecraft", "oak_stairs", (("facing", "north"),)),
         )
 
-        assert isinstance(result, SetblockCommand)
-        assert result.block.states is not None
-        assert result.block.states["facing"] == "east"
-        assert result.block.states["half"] == "top"
-        assert result.block.states["shape"] == "straight"
+    def test_block_states_sorted_and_hashable(self, parser: CommandParser) -> None:
+        """Test that state order in the source does not matter."""
+        first = parser.parse("/setblock 0 64 0 oak_stairs[half=top,facing=east]")
+        second = parser.parse("/setblock 0 64 0 oak_stairs[facing=east,half=top]")
 
-    def test_parse_fill_with_block_states(self) -> None:
-        """Test parsing fill command with block states."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:oak_stairs[facing=north]")
+        assert first.block.states == (("facing", "east"), ("half", "top"))
+        assert first.block == second.block
+        assert hash(first.block) == hash(second.block)
 
-        assert isinstance(result, FillCommand)
-        assert result.block.block_id == "oak_stairs"
-        assert result.block.states is not None
-        assert result.block.states["facing"] == "north"
+    def test_int_and_bool_states_not_interned_together(self, parser: CommandParser) -> None:
+        """Test that [powered=1] does not hand its spec to [powered=true].
+
+        True == 1, so the two spellings only stay apart if the interning
+        cache keys on the value types too.
+        """
+        as_int = parser.parse("/setblock 0 0 0 intern_test_lever[powered=1]")
+        as_bool = parser.parse("/setblock 5 0 0 intern_test_lever[powered=true]")
 
-    def test_parse_block_without_states(self) -> None:
+        assert as_int.block.states is not None
+        assert as_bool.block.states is not None
+        assert [(k, type(v), v) for k, v in as_int.block.states] == [("powered", int, 1)]
+        assert [(k, type(v), v) for k, v in as_bool.block.states] == [
+            ("powered", bool, True)
+        ]
+
+    def test_parse_block_without_states(self, parser: CommandParser) -> None:
         """Test that blocks without states still work."""
-        parser = CommandParser()
         result = parser.parse("/setblock 0 64 0 minecraft:stone")
 
-        assert isinstance(result, SetblockCommand)
-        assert result.block.block_id == "stone"
-        assert result.block.states is None
+        assert result == SetblockCommand(_at(0, 64, 0), BlockSpec("minecraft", "stone"))
 
 
 class TestFillModes:
     """Test fill mode parsing (Phase 3)."""
 
-    def test_parse_fill_default_mode(self) -> None:
-        """Test parsing fill without mode (defaults to replace)."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:stone")
-
-        assert isinstance(result, FillCommand)
-        assert result.mode == "replace"
-
-    def test_parse_fill_hollow_mode(self) -> None:
-        """Test parsing fill with hollow mode."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:stone hollow")
-
-        assert isinstance(result, FillCommand)
-        assert result.block.block_id == "stone"
-        assert result.mode == "hollow"
-
-    def test_parse_fill_destroy_mode(self) -> None:
-        """Test parsing fill with destroy mode."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:glass destroy")
-
-        assert isinstance(result, FillCommand)
-        assert result.mode == "destroy"
-
-    def test_parse_fill_keep_mode(self) -> None:
-        """Test parsing fill with keep mode."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:cobblestone keep")
-
-        assert isinstance(result, FillCommand)
-        assert result.mode == "keep"
-
-    def test_parse_fill_outline_mode(self) -> None:
-        """Test parsing fill with outline mode."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:glass outline")
-
-        assert isinstance(result, FillCommand)
-        assert result.mode == "outline"
-
-    def test_parse_fill_replace_mode(self) -> None:
-        """Test parsing fill with explicit replace mode."""
-        parser = CommandParser()
-        result = parser.parse("/fill 0 64 0 10 70 10 minecraft:dirt replace")
-
-        assert isinstance(result, FillCommand)
-        assert result.mode == "replace"
+    @pytest.mark.parametrize(
+        ("suffix", "mode"),
+        [
+            ("", "replace"),
+            (" hollow", "hollow"),
+            (" destroy", "destroy"),
+            (" keep", "keep"),
+            (" outline", "outline"),
+            (" replace", "replace"),
+        ],
+    )
+    def test_parse_fill_mode(
+        self, parser: CommandParser, suffix: str, mode: FillMode
+    ) -> None:
+        """Test each fill mode, and the replace default."""
+        result = parser.parse(f"/fill 0 64 0 10 70 10 minecraft:stone{suffix}")
+
+        assert result == FillCommand(
+            _at(0, 64, 0), _at(10, 70, 10), BlockSpec("minecraft", "stone"), mode
+        )
 
-    def test_parse_fill_hollow_with_block_states(self) -> None:
+    def test_parse_fill_hollow_with_block_states(self, parser: CommandParser) -> None:
         """Test parsing hollow fill with block states."""
-        parser = CommandParser()
         result = parser.parse(
             "/fill 0 65 0 9 69 7 spruce_planks[waterlogged=false] hollow"
         )
 
-        assert isinstance(result, FillCommand)
-        assert result.block.block_id == "spruce_planks"
-        assert result.block.states is not None
-        assert result.block.states["waterlogged"] is False
-        assert result.mode == "hollow"
+        assert result == FillCommand(
+            _at(0, 65, 0),
+            _at(9, 69, 7),
+            BlockSpec("minecraft", "spruce_planks", (("waterlogged", False),)),
+            "hollow",
+        )
@@ -0,0 +1,103 @@
+"""Tests for the high-level WorldEditor API."""
+
+from pathlib import Path
+
+from minecraft_holodeck.api import WorldEditor
+from minecraft_holodeck.world import create_void_world
+from tests._helpers import COMMANDS, block_names
+
+
+class TestExecuteMany:
+    """Test batched command execution."""
+
+    def test_execute_many_matches_sequential_execute(self, tmp_path: Path) -> None:
+        """Test that batching gives the same world as executing one by one."""
+        sequential = tmp_path / "sequential"
+        batched = tmp_path / "batched"
+        create_void_world(sequential, size_chunks=(2, 2), spawn_platform=False)
+        create_void_world(batched, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldEditor(sequential) as editor:
+            expected_count = sum(editor.execute(command) for command in COMMANDS)
+            editor.save()
+
+        with WorldEditor(batched) as editor:
+            count = editor.execute_many(COMMANDS)
+            editor.save()
+
+        assert count == expected_count
+        assert block_names(batched) == block_names(sequential)
+
+    def test_execute_many_fold_matches_unfolded(self, tmp_path: Path) -> None:
+        """Test that folding overlapping writes gives the same world."""
+        unfolded = tmp_path / "unfolded"
+        folded = tmp_path / "folded"
+        create_void_world(unfolded, size_chunks=(2, 2), spawn_platform=False)
+        create_void_world(folded, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldEditor(unfolded) as editor:
+            editor.execute_many(COMMANDS)
+            editor.save()
+
+        with WorldEditor(folded) as editor:
+            editor.execute_many(COMMANDS, fold=True)
+            editor.save()
+
+        assert block_names(folded) == block_names(unfolded)
+
+    def test_execute_script_matches_execute_many(self, tmp_path: Path) -> None:
+        """Test that a script file runs the same commands, skipping comments."""
+        script = tmp_path / "build.txt"
+        script.write_text(
+            "# build\n\n" + "\n".join(COMMANDS) + "\r\n  # trailing comment\n"
+        )
+        batched = tmp_path / "batched"
+        scripted = tmp_path / "scripted"
+        create_void_world(batched, size_chunks=(2, 2), spawn_platform=False)
+        create_void_world(scripted, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldEditor(batched) as editor:
+            expected_count = editor.execute_many(COMMANDS)
+            editor.save()
+
+        with WorldEditor(scripted) as editor:
+            count = editor.execute_script(script)
+            editor.save()
+
+        assert count == expected_count
+        assert block_names(scripted) == block_names(batched)
+
+    def test_execute_script_empty_file(self, tmp_path: Path) -> None:
+        """Test that an empty script modifies nothing."""
+        script = tmp_path / "empty.txt"
+        script.write_text("")
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(1, 1), spawn_platform=False)
+
+        with WorldEditor(world_path) as editor:
+            assert editor.execute_script(script) == 0
+
+
+class TestSetBlocks:
+    """Test scattered block placement."""
+
+    def test_set_blocks_matches_setblock(self, tmp_path: Path) -> None:
+        """Test that set_blocks places the same blocks as /setblock."""
+        positions = [(x, 65, z) for x in range(2, 21, 6) for z in range(2, 21, 6)]
+        positions.append((3, 66, 3))
+        sequential = tmp_path / "sequential"
+        batched = tmp_path / "batched"
+        create_void_world(sequential, size_chunks=(2, 2), spawn_platform=False)
+        create_void_world(batched, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldEditor(sequential) as editor:
+            for x, y, z in positions:
+                editor.execute(f"/setblock {x} {y} {z} minecraft:oak_fence")
+            editor.save()
+
+        with WorldEditor(batched) as editor:
+            count = editor.set_blocks(positions, "minecraft:oak_fence")
+            editor.save()
+
+        assert count == len(positions)
+        assert block_names(batched) == block_names(sequential)
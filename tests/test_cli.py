@@ -0,0 +1,146 @@
+"""Tests for the mccommand command-line interface."""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from minecraft_holodeck import converter
+from minecraft_holodeck.cli import main
+from minecraft_holodeck.world import create_void_world
+from tests._helpers import COMMANDS, block_names
+
+
+def _file_contents(world_path: Path) -> dict[str, bytes]:
+    """Read every file in a world folder, keyed by relative path."""
+    return {
+        str(path.relative_to(world_path)): path.read_bytes()
+        for path in sorted(world_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+class TestParseCommand:
+    """Test the parse debugging command."""
+
+    def test_block_states_are_an_object(self) -> None:
+        """Test that block states print as a JSON object, not a pair list."""
+        result = CliRunner().invoke(
+            main, ["parse", "/setblock 0 64 0 oak_stairs[facing=north,waterlogged=true]"]
+        )
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {
+            "position": {
+                "x": {"value": 0, "relative": False},
+                "y": {"value": 64, "relative": False},
+                "z": {"value": 0, "relative": False},
+            },
+            "block": {
+                "namespace": "minecraft",
+                "block_id": "oak_stairs",
+                "states": {"facing": "north", "waterlogged": True},
+            },
+            "mode": "replace",
+        }
+
+    def test_block_without_states(self) -> None:
+        """Test that a block without states prints null states."""
+        result = CliRunner().invoke(main, ["parse", "/fill 0 64 0 1 64 1 stone hollow"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert output["block"]["states"] is None
+        assert output["mode"] == "hollow"
+
+
+class TestBatchCommand:
+    """Test the batch command."""
+
+    def test_dry_run_reports_errors_and_leaves_world(self, tmp_path: Path) -> None:
+        """Test that --dry-run reports bad lines by number and writes nothing."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+        commands = tmp_path / "commands.txt"
+        commands.write_text(
+            "# floor\n"
+            "/fill 0 64 0 4 64 4 minecraft:stone\n"
+            "/setblock 0 65\n"
+            "\n"
+            "/setblock 2 65 2 minecraft:glass\n"
+            "/fill 0 0 0 stone\n"
+        )
+        before = _file_contents(world_path)
+
+        result = CliRunner().invoke(
+            main, ["batch", str(world_path), str(commands), "--dry-run"]
+        )
+
+        assert result.exit_code == 1
+        assert "Line 3 error" in result.stderr
+        assert "Line 6 error" in result.stderr
+        assert "Line 2" not in result.stderr
+        assert "Parsed 2 commands" in result.stdout
+        assert _file_contents(world_path) == before
+
+
+class TestExecuteScriptCommand:
+    """Test the execute-script command."""
+
+    def test_fold_matches_unfolded(self, tmp_path: Path) -> None:
+        """Test that --fold builds the same world as a plain run."""
+        script = tmp_path / "build.txt"
+        script.write_text("\n".join(COMMANDS) + "\n")
+        worlds = {}
+        for name, flags in (("plain", []), ("folded", ["--fold"])):
+            world_path = tmp_path / name
+            create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+            result = CliRunner().invoke(
+                main, ["execute-script", str(world_path), str(script), *flags]
+            )
+
+            assert result.exit_code == 0, result.output
+            worlds[name] = block_names(world_path)
+
+        assert worlds["folded"] == worlds["plain"]
+        assert worlds["plain"][(3, 64, 3)] == "universal_minecraft:glass"
+
+
+class TestConvertToRelativeCommand:
+    """Test the convert-to-relative command."""
+
+    def test_workers_match_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that -j gives byte-identical output and warnings in line order."""
+        monkeypatch.setattr(converter, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(converter, "READ_BLOCK_SIZE", 64)
+        script = tmp_path / "build.txt"
+        script.write_text("".join(
+            f"# layer {i}\n"
+            f"/fill 0 {64 + i} 0 9 {64 + i} 7 cobblestone\n"
+            f"/setblock {i} 70 -2 oak_stairs[facing=north,half=top]\n"
+            f"/setblock {i} 71 2 stone\n"
+            f"/setblock {i} 72\n"
+            "/setblock ~1 ~ ~ stone\n"
+            for i in range(20)
+        ))
+
+        outputs = {}
+        for name, flags in (("serial", []), ("pooled", ["-j", "2"])):
+            # Same file name, since the header mentions it
+            output = tmp_path / name / "build_relative.txt"
+            output.parent.mkdir()
+            result = CliRunner().invoke(
+                main, ["convert-to-relative", str(script), "-o", str(output), *flags]
+            )
+
+            assert result.exit_code == 0, result.output
+            outputs[name] = (output.read_bytes(), result.stdout.replace(str(output), ""))
+
+        assert outputs["pooled"] == outputs["serial"]
+        warned = re.findall(r"Could not parse line (\d+)", outputs["serial"][1])
+        assert warned == [str(6 * i + 5) for i in range(20)]
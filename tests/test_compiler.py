@@ -0,0 +1,52 @@
+"""Tests for script compilation."""
+
+from pathlib import Path
+
+import amulet  # type: ignore[import-untyped]
+
+from minecraft_holodeck.api import WorldEditor
+from minecraft_holodeck.compiler import compile_script
+from minecraft_holodeck.world import create_void_world
+from tests._helpers import COMMANDS, DIMENSION, block_names
+
+
+class TestCompileScript:
+    """Test compiled programs."""
+
+    def test_program_matches_execute_many(self, tmp_path: Path) -> None:
+        """Test that a compiled program can be run against several worlds."""
+        program = compile_script(COMMANDS + ["/fill 0 66 0 20 66 20 minecraft:sand keep"])
+        expected_path = tmp_path / "expected"
+        create_void_world(expected_path, size_chunks=(2, 2), spawn_platform=False)
+        with WorldEditor(expected_path) as editor:
+            expected_count = editor.execute_many(
+                COMMANDS + ["/fill 0 66 0 20 66 20 minecraft:sand keep"]
+            )
+            editor.save()
+
+        for name in ("first", "second"):
+            world_path = tmp_path / name
+            create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+            with WorldEditor(world_path) as editor:
+                count = program(editor.modifier)
+                editor.save()
+
+            assert count == expected_count
+            assert block_names(world_path) == block_names(expected_path)
+
+    def test_origin_is_applied_at_compile_time(self, tmp_path: Path) -> None:
+        """Test that relative coordinates resolve against the given origin."""
+        program = compile_script(["/setblock ~1 ~ ~2 minecraft:stone"], origin=(3, 64, 3))
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldEditor(world_path) as editor:
+            program(editor.modifier)
+            editor.save()
+
+        level = amulet.load_level(str(world_path))
+        try:
+            block = level.get_block(4, 64, 5, DIMENSION)
+        finally:
+            level.close()
+        assert block.namespaced_name == "universal_minecraft:stone"
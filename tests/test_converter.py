@@ -0,0 +1,325 @@
+"""Tests for absolute-to-relative script conversion."""
+
+from pathlib import Path
+
+import pytest
+
+from minecraft_holodeck import converter
+from minecraft_holodeck.converter import (
+    BoundingBox,
+    ScriptConverter,
+    _compute_coordinate_bounds,
+    _fast_convert,
+    _plain_block_bounds,
+)
+from minecraft_holodeck.parser import BlockSpec, CommandParser
+
+SCRIPT = """\
+# test build
+/fill 0 64 0 9 64 7 cobblestone
+
+/setblock 5 70 -2 oak_stairs[facing=north,half=top]
+/fill 1 65 1 8 65 6 spruce_planks hollow
+/setblock ~1 ~ ~ stone
+"""
+
+
+@pytest.fixture(scope="module")
+def build_script(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write SCRIPT once per module; tests only read it."""
+    path = tmp_path_factory.mktemp("scripts") / "build.txt"
+    path.write_text(SCRIPT)
+    return path
+
+
+def _body(path: Path) -> list[str]:
+    """Return the converted lines after the generated header."""
+    lines = path.read_text().splitlines()
+    return lines[lines.index("") + 1:]
+
+
+class TestConvertFile:
+    """Test file conversion."""
+
+    def test_convert_file_detects_base_and_bounds(self, tmp_path: Path, build_script: Path) -> None:
+        """Test that the base point and bbox come from absolute coordinates."""
+        base, bbox = ScriptConverter().convert_file(build_script, tmp_path / "out.txt")
+
+        assert base == (0, 64, -2)
+        assert bbox == BoundingBox(0, 64, -2, 9, 70, 7)
+        assert bbox == ScriptConverter().analyze_script(build_script)
+
+    def test_convert_file_output(self, tmp_path: Path, build_script: Path) -> None:
+        """Test the converted command lines."""
+        output = tmp_path / "out.txt"
+
+        ScriptConverter().convert_file(build_script, output)
+
+        assert _body(output) == [
+            "# test build",
+            "/fill ~ ~ ~+2 ~+9 ~ ~+9 minecraft:cobblestone",
+            "",
+            "/setblock ~+5 ~+6 ~ minecraft:oak_stairs[facing=north,half=top]",
+            "/fill ~+1 ~+1 ~+3 ~+8 ~+1 ~+8 minecraft:spruce_planks hollow",
+            "/setblock ~+1 ~ ~ minecraft:stone",
+        ]
+
+    def test_convert_file_explicit_base(self, tmp_path: Path) -> None:
+        """Test converting against a given base point."""
+        source = tmp_path / "build.txt"
+        output = tmp_path / "out.txt"
+        source.write_text("/setblock 10 64 10 stone\n")
+
+        base, bbox = ScriptConverter().convert_file(source, output, base_point=(5, 60, 5))
+
+        assert base == (5, 60, 5)
+        assert bbox == BoundingBox(10, 64, 10, 10, 64, 10)
+        assert _body(output) == ["/setblock ~+5 ~+4 ~+5 minecraft:stone"]
+
+    def test_convert_file_header_is_commented(self, tmp_path: Path, build_script: Path) -> None:
+        """Test that every header line, including the bbox size, is a comment."""
+        output = tmp_path / "out.txt"
+
+        ScriptConverter().convert_file(build_script, output)
+
+        lines = output.read_text().splitlines()
+        header = lines[:lines.index("")]
+        assert all(line.startswith("#") for line in header)
+        assert "#   Size: 10×7×10 (width×height×depth)" in header
+
+    def test_convert_file_far_offsets(self, tmp_path: Path) -> None:
+        """Test offsets beyond the precomputed table format the same way."""
+        source = tmp_path / "build.txt"
+        output = tmp_path / "out.txt"
+        source.write_text("/fill 0 64 0 5000 64 -3000 stone\n")
+
+        ScriptConverter().convert_file(source, output, base_point=(0, 64, 0))
+
+        assert _body(output) == ["/fill ~ ~ ~ ~+5000 ~ ~-3000 minecraft:stone"]
+
+    def test_parallel_bounds_match_serial(
+        self, tmp_path: Path, build_script: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that parsing in a worker pool gives the same bounds."""
+        monkeypatch.setattr(converter, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(converter, "READ_BLOCK_SIZE", 16)
+
+        serial = ScriptConverter().analyze_script(build_script)
+        parallel = ScriptConverter().analyze_script(build_script, n_workers=2)
+        base, bbox = ScriptConverter().convert_file(
+            build_script, tmp_path / "out.txt", n_workers=2
+        )
+
+        assert parallel == serial == bbox
+        assert base == (0, 64, -2)
+
+    def test_parallel_conversion_matches_serial(
+        self, tmp_path: Path, build_script: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that converting blocks in a worker pool keeps line order."""
+        monkeypatch.setattr(converter, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(converter, "READ_BLOCK_SIZE", 16)
+        serial = tmp_path / "serial.txt"
+        parallel = tmp_path / "parallel.txt"
+
+        ScriptConverter().convert_file(build_script, serial)
+        ScriptConverter().convert_file(build_script, parallel, n_workers=2)
+
+        assert _body(parallel) == _body(serial)
+
+    def test_convert_empty_script(self, tmp_path: Path) -> None:
+        """Test that a script without commands converts around the origin."""
+        source = tmp_path / "build.txt"
+        source.write_text("# nothing here\n")
+
+        base, bbox = ScriptConverter().convert_file(source, tmp_path / "out.txt")
+
+        assert base == (0, 0, 0)
+        assert bbox == BoundingBox.empty()
+
+
+class TestFastPath:
+    """Test the parser-free path for plain absolute commands."""
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "/setblock 1 64 -3 stone",
+            "setblock +1 64 3 minecraft:oak_planks",
+            "/fill 0 64 0 -5 70 2000 glass hollow",
+            "/fill 0  64 0 5 70 7 mymod:pipe/straight replace",
+        ],
+    )
+    def test_fast_path_matches_parser(self, line: str) -> None:
+        """Test that fast-path output equals converting the parsed AST."""
+        converter = ScriptConverter()
+        ast = CommandParser().parse(line)
+
+        converted = _fast_convert(line, (1, 60, 1))
+
+        assert converted is not None
+        assert converted == converter._convert_command(ast, (1, 60, 1))
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "/setblock ~1 64 3 stone",
+            "/setblock 1 64 3 lantern[hanging=true]",
+            "/setblock １ 64 3 stone",
+        ],
+    )
+    def test_fast_path_defers_to_parser(self, line: str) -> None:
+        """Test that relative, stateful and non-ASCII lines are not converted."""
+        assert _fast_convert(line, (1, 60, 1)) is None
+
+    def test_plain_setblock_block_bounds_match_parser(self) -> None:
+        """Test that scanning plain setblocks gives the parsed bounds."""
+        lines = [
+            "# floor\n",
+            "/setblock 1 64 -3 stone\r\n",
+            "\n",
+            "  setblock +7 70 3 minecraft:oak_planks  \n",
+            "/setblock -2 65 0 mymod:pipe/straight",
+        ]
+        parser = CommandParser()
+        commands = [
+            (parser.parse(line.strip()),)
+            for line in lines
+            if line.strip() and not line.startswith("#")
+        ]
+
+        assert _plain_block_bounds(lines) == _compute_coordinate_bounds(commands)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "/setblock ~1 64 3 stone\n",
+            "/setblock 1 64 3 lantern[hanging=true]\n",
+            "/fill 0 64 0 1 64 1 stone\n",
+            "/setblock 1 64\n",
+            "/setblock １ 64 3 stone\n",
+        ],
+    )
+    def test_plain_block_bounds_defers_other_lines(self, line: str) -> None:
+        """Test that a block with any other command is left to the parser."""
+        assert _plain_block_bounds(["/setblock 1 64 3 stone\n", line]) is None
+
+
+class TestFormatBlock:
+    """Test block spec formatting."""
+
+    def test_formatted_block_parses_back(self) -> None:
+        """Test that bool and int states round-trip through the parser."""
+        parser = CommandParser()
+        block = parser.parse_block("lantern[waterlogged=false,hanging=true,level=3]")
+
+        text = ScriptConverter()._format_block(block)
+
+        assert text == "minecraft:lantern[hanging=true,level=3,waterlogged=false]"
+        assert parser.parse_block(text) == block
+
+    def test_int_and_bool_states_formatted_apart(self) -> None:
+        """Test that [powered=1] is not reused for [powered=true]."""
+        converter = ScriptConverter()
+
+        as_int = converter._format_block(BlockSpec("minecraft", "lever", (("powered", 1),)))
+        as_bool = converter._format_block(BlockSpec("minecraft", "lever", (("powered", True),)))
+
+        assert as_int == "minecraft:lever[powered=1]"
+        assert as_bool == "minecraft:lever[powered=true]"
+
+
+class TestOptimizeFills:
+    """Test merging of adjacent fills."""
+
+    def test_row_of_setblocks_becomes_one_fill(self) -> None:
+        """Test that a run of neighbouring setblocks collapses into a fill."""
+        parser = CommandParser()
+        commands = [parser.parse(f"/setblock {x} 64 3 stone") for x in range(5)]
+
+        merged = ScriptConverter().optimize_fills(commands)
+
+        assert merged == [parser.parse("/fill 0 64 3 4 64 3 stone")]
+
+    def test_rows_merge_into_a_plane(self) -> None:
+        """Test that matching rows merge along the next axis."""
+        parser = CommandParser()
+        commands = [
+            parser.parse("/fill 0 64 0 9 64 0 stone"),
+            parser.parse("/fill 0 64 1 9 64 1 stone"),
+            parser.parse("/fill 9 64 2 0 64 2 stone"),
+        ]
+
+        merged = ScriptConverter().optimize_fills(commands)
+
+        assert merged == [parser.parse("/fill 0 64 0 9 64 2 stone")]
+
+    def test_unmergeable_commands_are_kept_in_order(self) -> None:
+        """Test that different blocks, gaps, relative coords and modes stay."""
+        parser = CommandParser()
+        commands = [
+            parser.parse("/setblock 0 64 0 stone"),
+            parser.parse("/setblock 1 64 0 dirt"),
+            parser.parse("/setblock 3 64 0 dirt"),
+            parser.parse("/setblock ~4 64 0 dirt"),
+            parser.parse("/fill 0 65 0 4 65 0 stone hollow"),
+            parser.parse("/fill 0 66 0 4 66 0 stone hollow"),
+        ]
+
+        assert ScriptConverter().optimize_fills(commands) == commands
+
+    def test_int_and_bool_states_do_not_merge(self) -> None:
+        """Test that [powered=1] and [powered=true] are not one fill."""
+        parser = CommandParser()
+        commands = [
+            parser.parse("/setblock 0 0 0 lever[powered=1]"),
+            parser.parse("/setblock 1 0 0 lever[powered=true]"),
+        ]
+
+        merged = ScriptConverter().optimize_fills(commands)
+
+        assert len(merged) == 2
+        assert merged[1].block.states == (("powered", True),)
+        assert [type(v) for _, v in merged[1].block.states] == [bool]
+
+    def test_convert_file_merge(self, tmp_path: Path) -> None:
+        """Test that --merge output writes fewer commands, split by comments."""
+        source = tmp_path / "build.txt"
+        output = tmp_path / "out.txt"
+        source.write_text(
+            "/setblock 0 64 0 stone\n/setblock 1 64 0 stone\n"
+            "# roof\n/setblock 2 64 0 stone\n"
+        )
+
+        ScriptConverter().convert_file(source, output, merge=True)
+
+        assert _body(output) == [
+            "/fill ~ ~ ~ ~+1 ~ ~ minecraft:stone",
+            "# roof",
+            "/setblock ~+2 ~ ~ minecraft:stone",
+        ]
+
+
+class TestCoordinateBounds:
+    """Test bounds computation."""
+
+    def test_bounds_ignore_relative_axes(self) -> None:
+        """Test that relative coordinates don't count, per axis."""
+        parser = CommandParser()
+        commands = [
+            (parser.parse("/fill 3 ~0 -4 10 ~2 6 stone"),),
+            (None,),
+            (parser.parse("/setblock -1 ~5 ~ stone"),),
+        ]
+
+        min_c, max_c = _compute_coordinate_bounds(iter(commands))
+
+        assert min_c == (-1.0, float("inf"), -4.0)
+        assert max_c == (10.0, float("-inf"), 6.0)
+
+    def test_bounds_of_nothing_are_infinite(self) -> None:
+        """Test that no commands give infinite bounds."""
+        min_c, max_c = _compute_coordinate_bounds(iter([]))
+
+        assert min_c == (float("inf"),) * 3
+        assert max_c == (float("-inf"),) * 3
@@ -0,0 +1,75 @@
+"""Tests for write folding."""
+
+from minecraft_holodeck.planner import FillOp, fold_writes
+
+
+def _render(ops: list[FillOp[str]]) -> dict[tuple[int, int, int], str]:
+    """Play ops into a sparse voxel map, one voxel at a time."""
+    world: dict[tuple[int, int, int], str] = {}
+    for x1, y1, z1, x2, y2, z2, block, mode in ops:
+        xs = range(min(x1, x2), max(x1, x2) + 1)
+        ys = range(min(y1, y2), max(y1, y2) + 1)
+        zs = range(min(z1, z2), max(z1, z2) + 1)
+        for x in xs:
+            for y in ys:
+                for z in zs:
+                    sides = (
+                        (x in (xs[0], xs[-1])) + (y in (ys[0], ys[-1])) + (z in (zs[0], zs[-1]))
+                    )
+                    if mode == "keep":
+                        world.setdefault((x, y, z), block)
+                    elif mode == "outline" and sides < 2:
+                        continue
+                    elif mode == "hollow" and not sides:
+                        world[(x, y, z)] = "air"
+                    else:
+                        world[(x, y, z)] = block
+    return world
+
+
+class TestFoldWrites:
+    """Test that folding preserves the final state."""
+
+    def test_fold_matches_sequential_writes(self) -> None:
+        """Test that folded ops leave the same voxels as the originals."""
+        ops: list[FillOp[str]] = [
+            (0, 64, 0, 10, 72, 8, "air", "replace"),
+            (0, 64, 0, 9, 64, 7, "cobblestone", "replace"),
+            (1, 65, 1, 8, 65, 6, "planks", "replace"),
+            (0, 66, 0, 9, 69, 7, "log", "hollow"),
+            (2, 70, 2, 6, 73, 6, "glass", "outline"),
+            (5, 66, 3, 5, 66, 3, "torch", "replace"),
+        ]
+
+        folded = fold_writes(ops, air="air")
+
+        assert all(op[7] == "replace" for op in folded)
+        assert _render(folded) == _render(ops)
+        assert sum(
+            (op[3] - op[0] + 1) * (op[4] - op[1] + 1) * (op[5] - op[2] + 1)
+            for op in folded
+        ) == len(_render(ops))
+
+    def test_keep_splits_folding(self) -> None:
+        """Test that keep ops pass through in order."""
+        ops: list[FillOp[str]] = [
+            (0, 0, 0, 3, 0, 3, "stone", "replace"),
+            (0, 0, 0, 1, 0, 1, "dirt", "replace"),
+            (0, 0, 0, 5, 0, 5, "sand", "keep"),
+            (4, 0, 4, 4, 0, 4, "glass", "replace"),
+        ]
+
+        folded = fold_writes(ops, air="air")
+
+        assert ops[2] in folded
+        assert folded[-1] == ops[3]
+        assert _render(folded) == _render(ops)
+
+    def test_oversized_union_is_not_folded(self) -> None:
+        """Test that sparse ops spanning a huge area pass through."""
+        ops: list[FillOp[str]] = [
+            (0, 0, 0, 0, 0, 0, "stone", "replace"),
+            (10_000, 0, 10_000, 10_000, 0, 10_000, "stone", "replace"),
+        ]
+
+        assert fold_writes(ops, air="air", max_cells=1 << 20) == ops
@@ -1,45 +1,56 @@
 """Tests for world creation."""
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
-import pytest
 import amulet  # type: ignore[import-untyped]
+import amulet_nbt
+import pytest
 
 from minecraft_holodeck.exceptions import WorldOperationError
 from minecraft_holodeck.world import create_flat_world, create_void_world
 
 
-class TestFlatWorldCreation:
-    """Test flat world creation."""
+@pytest.fixture(scope="module")
+def flat_world(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one default 2x2 flat world, from a string path, per module."""
+    world_path = tmp_path_factory.mktemp("flat") / "flat_world"
+    create_flat_world(str(world_path), size_chunks=(2, 2))
+    return world_path
 
-    def test_create_flat_world_creates_directory(self, tmp_path: Path) -> None:
-        """Test that flat world creation creates the world directory."""
-        world_path = tmp_path / "test_world"
-        assert not world_path.exists()
 
-        create_flat_world(world_path, size_chunks=(2, 2))
+@pytest.fixture(scope="module")
+def void_world(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one default 2x2 void world per module."""
+    world_path = tmp_path_factory.mktemp("void") / "void_world"
+    create_void_world(world_path, size_chunks=(2, 2))
+    return world_path
 
-        assert world_path.exists()
-        assert world_path.is_dir()
 
-    def test_create_flat_world_creates_level_dat(self, tmp_path: Path) -> None:
-        """Test that flat world creation creates level.dat file."""
-        world_path = tmp_path / "test_world"
+@pytest.fixture(scope="module")
+def flat_level(flat_world: Path) -> Iterator[Any]:
+    """Open the shared flat world once for read-only checks."""
+    level = amulet.load_level(str(flat_world))
+    yield level
+    level.close()
 
-        create_flat_world(world_path, size_chunks=(2, 2))
 
-        level_dat = world_path / "level.dat"
-        assert level_dat.exists()
+class TestFlatWorldCreation:
+    """Test flat world creation."""
 
-    def test_create_flat_world_is_loadable(self, tmp_path: Path) -> None:
-        """Test that created world can be loaded by amulet."""
-        world_path = tmp_path / "test_world"
+    def test_create_flat_world_creates_directory(self, flat_world: Path) -> None:
+        """Test that flat world creation creates the world directory."""
+        assert flat_world.is_dir()
 
-        create_flat_world(world_path, size_chunks=(2, 2))
+    def test_create_flat_world_creates_level_dat(self, flat_world: Path) -> None:
+        """Test that flat world creation creates level.dat file."""
+        level_dat = flat_world / "level.dat"
+        assert level_dat.exists()
 
-        # Should not raise an exception
-        level = amulet.load_level(str(world_path))
-        level.close()
+    def test_create_flat_world_is_loadable(self, flat_level: Any) -> None:
+        """Test that created world can be loaded by amulet."""
+        assert "minecraft:overworld" in flat_level.dimensions
 
     def test_create_flat_world_custom_name(self, tmp_path: Path) -> None:
         """Test that custom world name is set correctly."""
@@ -54,17 +65,11 @@ class TestFlatWorldCreation:
 
         assert actual_name == custom_name
 
-    def test_create_flat_world_default_name_is_folder(self, tmp_path: Path) -> None:
+    def test_create_flat_world_default_name_is_folder(self, flat_level: Any) -> None:
         """Test that default world name is the folder name."""
-        world_path = tmp_path / "my_folder_name"
-
-        create_flat_world(world_path, size_chunks=(2, 2))
-
-        level = amulet.load_level(str(world_path))
-        actual_name = level.level_wrapper.root_tag["Data"]["LevelName"].py_str
-        level.close()
+        actual_name = flat_level.level_wrapper.root_tag["Data"]["LevelName"].py_str
 
-        assert actual_name == "my_folder_name"
+        assert actual_name == "flat_world"
 
     def test_create_flat_world_custom_layers(self, tmp_path: Path) -> None:
         """Test creating flat world with custom layers."""
@@ -104,47 +109,34 @@ class TestFlatWorldCreation:
         assert spawn_x == expected_x
         assert spawn_z == expected_z
 
-    def test_create_flat_world_with_string_path(self, tmp_path: Path) -> None:
+    def test_create_flat_world_with_string_path(self, flat_world: Path) -> None:
         """Test that string paths work (not just Path objects)."""
-        world_path = tmp_path / "string_path_world"
-
-        # Pass as string instead of Path
-        create_flat_world(str(world_path), size_chunks=(2, 2))
-
-        assert world_path.exists()
+        # The shared world is created from str(path)
+        assert (flat_world / "level.dat").exists()
 
 
 class TestVoidWorldCreation:
     """Test void world creation."""
 
-    def test_create_void_world_creates_directory(self, tmp_path: Path) -> None:
+    def test_create_void_world_creates_directory(self, void_world: Path) -> None:
         """Test that void world creation creates the world directory."""
-        world_path = tmp_path / "void_world"
-        assert not world_path.exists()
+        assert void_world.is_dir()
 
-        create_void_world(world_path, size_chunks=(2, 2))
-
-        assert world_path.exists()
-        assert world_path.is_dir()
-
-    def test_create_void_world_creates_level_dat(self, tmp_path: Path) -> None:
+    def test_create_void_world_creates_level_dat(self, void_world: Path) -> None:
         """Test that void world creation creates level.dat file."""
-        world_path = tmp_path / "void_world"
-
-        create_void_world(world_path, size_chunks=(2, 2))
-
-        level_dat = world_path / "level.dat"
+        level_dat = void_world / "level.dat"
         assert level_dat.exists()
 
-    def test_create_void_world_is_loadable(self, tmp_path: Path) -> None:
-        """Test that created void world can be loaded by amulet."""
-        world_path = tmp_path / "void_world"
+    def test_create_void_world_is_loadable(self, void_world: Path) -> None:
+        """Test that the void world's level.dat parses as NBT.
 
-        create_void_world(world_path, size_chunks=(2, 2))
+        The full amulet load is covered by the flat world and by the void
+        tests that read blocks and spawn back.
+        """
+        level_dat = amulet_nbt.load(str(void_world / "level.dat"))
 
-        # Should not raise an exception
-        level = amulet.load_level(str(world_path))
-        level.close()
+        data = level_dat.compound.get_compound("Data")
+        assert data.get_string("LevelName").py_str == "void_world"
 
     def test_create_void_world_custom_name(self, tmp_path: Path) -> None:
         """Test that custom world name is set correctly."""
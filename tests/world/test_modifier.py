@@ -0,0 +1,172 @@
+"""Tests for world modification."""
+
+from pathlib import Path
+
+import amulet  # type: ignore[import-untyped]
+from amulet.api.block import Block  # type: ignore[import-untyped]
+
+from minecraft_holodeck.world import create_void_world
+from minecraft_holodeck.world.modifier import WorldModifier
+
+DIMENSION = "minecraft:overworld"
+
+
+def _block_name(world_path: Path, x: int, y: int, z: int) -> str:
+    """Read back the block name at a position."""
+    level = amulet.load_level(str(world_path))
+    try:
+        return str(level.get_block(x, y, z, DIMENSION).namespaced_name)
+    finally:
+        level.close()
+
+
+class TestFillRegion:
+    """Test fill modes."""
+
+    def test_fill_replace_across_chunks(self, tmp_path: Path) -> None:
+        """Test that a fill spanning a chunk border fills every block."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            count = modifier.fill_region(
+                10, 64, 10, 20, 65, 20, Block("minecraft", "stone"), "replace"
+            )
+            modifier.save()
+
+        assert count == 11 * 2 * 11
+        assert _block_name(world_path, 10, 64, 10) == "universal_minecraft:stone"
+        assert _block_name(world_path, 20, 65, 20) == "universal_minecraft:stone"
+        assert _block_name(world_path, 21, 64, 20) == "universal_minecraft:air"
+
+    def test_fill_hollow_clears_interior(self, tmp_path: Path) -> None:
+        """Test that hollow mode builds walls and fills the inside with air."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            modifier.fill_region(0, 64, 0, 4, 68, 4, Block("minecraft", "dirt"), "replace")
+            count = modifier.fill_region(
+                0, 64, 0, 4, 68, 4, Block("minecraft", "stone"), "hollow"
+            )
+            modifier.save()
+
+        assert count == 5 * 5 * 5 - 3 * 3 * 3
+        assert _block_name(world_path, 0, 66, 2) == "universal_minecraft:stone"
+        assert _block_name(world_path, 2, 66, 2) == "universal_minecraft:air"
+
+    def test_fill_outline_writes_only_edges(self, tmp_path: Path) -> None:
+        """Test that outline mode writes the 12 edges and leaves the rest."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            modifier.fill_region(14, 64, 0, 18, 68, 4, Block("minecraft", "dirt"), "replace")
+            count = modifier.fill_region(
+                14, 64, 0, 18, 68, 4, Block("minecraft", "stone"), "outline"
+            )
+            modifier.save()
+
+        assert count == 4 * 5 + 4 * 3 + 4 * 3
+        assert _block_name(world_path, 16, 64, 0) == "universal_minecraft:stone"
+        assert _block_name(world_path, 14, 66, 0) == "universal_minecraft:stone"
+        assert _block_name(world_path, 18, 68, 2) == "universal_minecraft:stone"
+        assert _block_name(world_path, 14, 66, 2) == "universal_minecraft:dirt"
+        assert _block_name(world_path, 16, 66, 2) == "universal_minecraft:dirt"
+
+    def test_fill_outline_flat_box_is_a_rectangle(self, tmp_path: Path) -> None:
+        """Test that a one-block-tall outline writes each border cell once."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            count = modifier.fill_region(
+                0, 64, 0, 4, 64, 3, Block("minecraft", "stone"), "outline"
+            )
+            modifier.save()
+
+        assert count == 2 * 5 + 2 * 2
+        assert _block_name(world_path, 4, 64, 2) == "universal_minecraft:stone"
+        assert _block_name(world_path, 2, 64, 2) == "universal_minecraft:air"
+
+    def test_fill_single_block(self, tmp_path: Path) -> None:
+        """Test that one-block fills place the block, except over blocks in keep."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            stone = Block("minecraft", "stone")
+            hollow = modifier.fill_region(3, 64, 3, 3, 64, 3, stone, "hollow")
+            kept = modifier.fill_region(3, 64, 3, 3, 64, 3, Block("minecraft", "dirt"), "keep")
+            modifier.save()
+
+        assert (hollow, kept) == (1, 0)
+        assert _block_name(world_path, 3, 64, 3) == "universal_minecraft:stone"
+
+    def test_fill_keep_only_replaces_air(self, tmp_path: Path) -> None:
+        """Test that keep mode fills air and leaves existing blocks alone."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            modifier.set_block(1, 70, 1, Block("minecraft", "dirt"))
+            count = modifier.fill_region(
+                0, 70, 0, 3, 70, 3, Block("minecraft", "stone"), "keep"
+            )
+            modifier.save()
+
+        assert count == 15
+        assert _block_name(world_path, 1, 70, 1) == "universal_minecraft:dirt"
+        assert _block_name(world_path, 0, 70, 0) == "universal_minecraft:stone"
+
+    def test_fill_keep_across_sub_chunks(self, tmp_path: Path) -> None:
+        """Test keep mode over existing and missing sub-chunks."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            modifier.set_block(2, 75, 2, Block("minecraft", "dirt"))
+            count = modifier.fill_region(
+                0, 60, 0, 3, 100, 3, Block("minecraft", "stone"), "keep"
+            )
+            modifier.save()
+
+        assert count == 4 * 41 * 4 - 1
+        assert _block_name(world_path, 2, 75, 2) == "universal_minecraft:dirt"
+        assert _block_name(world_path, 3, 100, 3) == "universal_minecraft:stone"
+
+
+class TestSave:
+    """Test saving."""
+
+    def test_save_is_idempotent(self, tmp_path: Path) -> None:
+        """Test that a second save with no changes does not rewrite files."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            modifier.set_block(1, 64, 1, Block("minecraft", "stone"))
+            modifier.save()
+            level_dat = world_path / "level.dat"
+            saved_at = level_dat.stat().st_mtime_ns
+            assert not modifier.world.changed
+
+            modifier.save()
+
+            assert level_dat.stat().st_mtime_ns == saved_at
+
+        assert _block_name(world_path, 1, 64, 1) == "universal_minecraft:stone"
+
+    def test_chunk_writes_mark_world_changed(self, tmp_path: Path) -> None:
+        """Test that fills on a loaded chunk are picked up by save."""
+        world_path = tmp_path / "world"
+        create_void_world(world_path, size_chunks=(2, 2), spawn_platform=False)
+
+        with WorldModifier(str(world_path)) as modifier:
+            modifier.fill_region(0, 64, 0, 1, 64, 1, Block("minecraft", "stone"), "replace")
+            modifier.save()
+            modifier.fill_region(0, 65, 0, 1, 65, 1, Block("minecraft", "dirt"), "replace")
+            assert modifier.world.changed
+            modifier.save()
+
+        assert _block_name(world_path, 0, 65, 0) == "universal_minecraft:dirt"